@@ -0,0 +1,60 @@
+'''blit a full level with raw loaded images and display-converted images
+
+usage: python -m benchmarks.blit_convert [frames]
+'''
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+
+from engine import lib, settings
+
+
+def _level_blits(images: dict[str, pg.surface.Surface],
+                 world_data: lib.GameDataStruct) -> list[tuple[pg.surface.Surface, tuple[int, int]]]:
+    blits: list[tuple[pg.surface.Surface, tuple[int, int]]] = []
+    for index, lay in enumerate(lib.com_fuc.listdir_clean(settings.GAME_PLAY_BACK_IMG_PATH)):
+        blits.append((images[os.path.join(settings.GAME_PLAY_BACK_IMG_PATH, lay)], (0, index*80)))
+    for img_type, datas_info in ((settings.IMG_TYPE_ITEMS, world_data.items_data),
+                                 (settings.IMG_TYPE_TILES, world_data.tiles_data)):
+        folder = settings.ITEMS_IMG_PATH if img_type == settings.IMG_TYPE_ITEMS else settings.TILES_IMG_PATH
+        for data_info in datas_info:
+            path = os.path.join(folder, f'{data_info["img"]}.png')
+            position = (data_info['x'] * settings.TILE_SIZE[0] % settings.SCREEN_WIDTH,
+                        data_info['y'] * settings.TILE_SIZE[1])
+            blits.append((images[path], position))
+    return blits
+
+def _run(screen: pg.surface.Surface,
+         blits: list[tuple[pg.surface.Surface, tuple[int, int]]],
+         frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        for img, position in blits:
+            screen.blit(img, position)
+    return (time.perf_counter() - start) / frames * 1000
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pg.init()
+    screen = pg.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    world_data = lib.GameDataStruct.load_world_data(
+        os.path.join(settings.WORLD_DATA_PATH, '0.pk'))
+    paths = [os.path.join(folder, file)
+             for folder in (settings.GAME_PLAY_BACK_IMG_PATH, settings.TILES_IMG_PATH, settings.ITEMS_IMG_PATH)
+             for file in lib.com_fuc.listdir_clean(folder)]
+    raw_images = {path: pg.image.load(path) for path in paths}
+    converted_images = {path: lib.asset_cache.convert_to_display(img)
+                        for path, img in raw_images.items()}
+    raw_ms = _run(screen, _level_blits(raw_images, world_data), frames)
+    converted_ms = _run(screen, _level_blits(converted_images, world_data), frames)
+    print(f'raw:       {raw_ms:.3f} ms/frame')
+    print(f'converted: {converted_ms:.3f} ms/frame')
+    print(f'speedup:   {raw_ms/converted_ms:.2f}x')
+    pg.quit()
+
+if __name__ == '__main__':
+    main()
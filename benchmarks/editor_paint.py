@@ -0,0 +1,38 @@
+'''paint, repaint and erase every cell of a level the way the editor does
+
+usage: python -m benchmarks.editor_paint [columns] [rows]
+'''
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from engine import lib, settings
+
+
+def _timed(name: str, cells: list[tuple[int, int]], paint: Callable[[int, int], None]) -> None:
+    start = time.perf_counter()
+    for x, y in cells:
+        paint(x, y)
+    elapsed = time.perf_counter() - start
+    print(f'{name:8s} {elapsed*1000:9.1f} ms  {elapsed/len(cells)*1e6:8.2f} us/cell')
+
+def main() -> None:
+    columns = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    rng = random.Random(0)
+    world_data = lib.GameDataStruct([], [], [], {}, {})
+    # a stroke moves across the level a column at a time
+    cells = [(x, y) for x in range(columns) for y in range(rows)]
+    print(f'level: {columns}x{rows} ({len(cells)} cells)')
+    _timed('paint', cells, lambda x, y: world_data.add_tile_by_type(
+        {'x': x, 'y': y, 'img': rng.randrange(10)}, settings.IMG_TYPE_TILES))
+    # later strokes land anywhere on the painted level
+    rng.shuffle(cells)
+    _timed('repaint', cells, lambda x, y: world_data.add_tile_by_type(
+        {'x': x, 'y': y, 'img': rng.randrange(10)}, settings.IMG_TYPE_TILES))
+    rng.shuffle(cells)
+    _timed('erase', cells, world_data.delete_tile_by_pos)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+'''load synthetic levels pickled and as binary level files
+
+usage: python -m benchmarks.level_load [repeats]
+'''
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from engine import lib
+from engine.lib import level_file
+from .levels import generate_level
+
+SIZES = (1_000, 10_000, 50_000, 200_000)
+
+
+def _timed(load: Callable[[], object], repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f'{"tiles":>8s} {"pk KB":>8s} {"lvl KB":>8s} {"pickle ms":>10s} '
+          f'{"lvl ms":>8s} {"lvl+rows ms":>12s} {"struct ms":>10s}')
+    with tempfile.TemporaryDirectory() as folder:
+        for tiles in SIZES:
+            pk_path = os.path.join(folder, f'{tiles}.pk')
+            lvl_path = os.path.join(folder, f'{tiles}{level_file.LEVEL_EXT}')
+            world_data = generate_level(tiles, tiles // 10, tiles // 100)
+            world_data.write_world_data(pk_path)
+            lib.LevelData.from_world_data(world_data).write(lvl_path)
+            pickle_ms = _timed(lambda: lib.GameDataStruct.load_world_data(pk_path), repeats)
+            lvl_ms = _timed(lambda: lib.LevelData.load(lvl_path), repeats)
+            # what game play reads: every layer's rows and the solid cells
+            rows_ms = _timed(lambda: [
+                (level.rows(img_type), level.solid_cells())
+                for level in (lib.LevelData.load(lvl_path),)
+                for img_type in level_file.LAYERS], repeats)
+            numpy = level_file.np
+            level_file.np = None
+            try:
+                struct_ms = _timed(lambda: lib.LevelData.load(lvl_path), repeats)
+            finally:
+                level_file.np = numpy
+            print(f'{tiles:8d} {os.path.getsize(pk_path)/1024:8.0f} '
+                  f'{os.path.getsize(lvl_path)/1024:8.0f} {pickle_ms:10.2f} '
+                  f'{lvl_ms:8.2f} {rows_ms:12.2f} {struct_ms:10.2f}')
+
+if __name__ == '__main__':
+    main()
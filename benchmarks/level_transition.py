@@ -0,0 +1,72 @@
+'''walk into the exit of generated levels and time the switch to the next one
+
+levels are written to a temporary folder with the exit three screens from
+the player. steps are paced at the update rate like the game loop, the
+worst step before the switch includes the next level being prepared.
+times are the median of a few runs
+
+usage: python -m benchmarks.level_transition [tiles ...]
+'''
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from engine import headless, lib, settings
+from .levels import generate_level
+
+SIZES = (1_000, 10_000, 50_000)
+EXIT_COLUMN = 60
+MAX_FRAMES = 1200
+REPEATS = 3
+
+
+def _run(tiles: int, preload: bool) -> tuple[float, float, int]:
+    '''switch ms, worst step ms before the switch and steps played'''
+    settings.PRELOAD_NEXT_LEVEL = preload
+    run_right = lib.InputScript({0: [('RUN_RIGHT', True)]})
+    headless_game = headless.HeadlessGame(0, run_right, seed=0)
+    play = headless_game.game_play
+    worst_ms = 0.0
+    step = 1 / settings.UPDATE_RATE
+    frame = 0
+    for frame in range(MAX_FRAMES):
+        start = time.perf_counter()
+        update_ms, draw_ms = headless_game.step(frame)
+        if play.transitions:
+            break
+        worst_ms = max(worst_ms, update_ms + draw_ms)
+        time.sleep(max(step - (time.perf_counter() - start), 0))
+    headless_game.quit()
+    if not play.transitions:
+        raise RuntimeError(f'no level switch in {MAX_FRAMES} steps')
+    return play.transitions[0][1], worst_ms, frame
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or list(SIZES)
+    world_data_path = settings.WORLD_DATA_PATH
+    print(f'{"tiles":>8s} {"preload":>8s} {"switch ms":>10s} {"worst step ms":>14s} {"steps":>6s}')
+    try:
+        for tiles in sizes:
+            with tempfile.TemporaryDirectory() as folder:
+                settings.WORLD_DATA_PATH = folder
+                for level in (0, 1):
+                    world_data = generate_level(tiles, tiles // 20, tiles // 100, seed=level)
+                    world_data.level_info[settings.LEVEL_INFO_EXIT] = EXIT_COLUMN
+                    lib.LevelData.from_world_data(world_data).write(
+                        lib.level_file.level_path(folder, level))
+                for preload in (False, True):
+                    runs = [_run(tiles, preload) for _ in range(REPEATS)]
+                    switch_ms = statistics.median(run[0] for run in runs)
+                    worst_ms = statistics.median(run[1] for run in runs)
+                    steps = runs[0][2]
+                    print(f'{tiles:8d} {str(preload):>8s} {switch_ms:10.2f} {worst_ms:14.2f} {steps:6d}')
+    finally:
+        settings.WORLD_DATA_PATH = world_data_path
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+'''synthetic levels for benchmarks'''
+import math
+import random
+
+from engine import lib, settings
+
+FLOOR_ROWS = (13, 12)
+PLATFORM_ROW = 8
+ROLE_ROW = 10
+ITEM_ROW = 11
+TILE_IMGS = (0, 1, 2, 3, 4, 5)
+ITEM_IMGS = tuple(range(1, 9))
+
+
+def generate_level(tiles: int, items: int, enemies: int, seed: int = 0) -> lib.GameDataStruct:
+    '''a flat level with a two row floor and broken platforms above it
+
+    the level is as long as needed to hold the tiles at three tiles a column
+    '''
+    rng = random.Random(seed)
+    columns = max(math.ceil(tiles / 3), 30)
+    rows = FLOOR_ROWS + (PLATFORM_ROW,)
+    tiles_data: list[dict[str, int]] = []
+    for row in rows:
+        for x in range(columns):
+            if len(tiles_data) >= tiles:
+                break
+            tiles_data.append({'x': x, 'y': row, 'img': rng.choice(TILE_IMGS)})
+    items_data = [{'x': x, 'y': ITEM_ROW, 'img': rng.choice(ITEM_IMGS)}
+                  for x in sorted(rng.sample(range(columns), min(items, columns)))]
+    sprites_data = [{'x': 2, 'y': ROLE_ROW, 'img': settings.PLAYER_TILES[0]}]
+    for index in range(enemies):
+        x = 10 + int(index * (columns - 12) / max(enemies, 1))
+        sprites_data.append({'x': x, 'y': ROLE_ROW, 'img': settings.ENEMY_TILES[0]})
+    return lib.GameDataStruct(
+        tiles_data, items_data, sprites_data,
+        {settings.IMG_TYPE_TILES: list(TILE_IMGS)}, {}
+    )
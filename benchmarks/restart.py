@@ -0,0 +1,40 @@
+'''time restarting generated levels against loading them
+
+usage: python -m benchmarks.restart [tiles ...]
+'''
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from engine import headless, lib, settings
+from .levels import generate_level
+
+SIZES = (1_000, 10_000, 50_000)
+PLAY_STEPS = 120
+RESTARTS = 5
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or list(SIZES)
+    print(f'{"tiles":>8s} {"load ms":>9s} {"restart ms":>11s} {"frame budget ms":>16s}')
+    for tiles in sizes:
+        world_data = generate_level(tiles, tiles // 20, tiles // 100)
+        start = time.perf_counter()
+        headless_game = headless.HeadlessGame(0, lib.DemoInput(), seed=0, world_data=world_data)
+        load_ms = (time.perf_counter() - start) * 1000
+        restart_ms = float('inf')
+        for _ in range(RESTARTS):
+            # play a while so there are bullets, dead enemies and released chunks
+            for frame in range(PLAY_STEPS):
+                headless_game.step(frame)
+            start = time.perf_counter()
+            headless_game.game_play.restart()
+            restart_ms = min(restart_ms, (time.perf_counter() - start) * 1000)
+        headless_game.quit()
+        print(f'{tiles:8d} {load_ms:9.2f} {restart_ms:11.3f} {1000 / settings.UPDATE_RATE:16.2f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+'''run generated stress levels headless and report frame times as JSON
+
+usage: python -m benchmarks.stress [--scenario NAME ...] [--output FILE]
+       python -m benchmarks.stress --tiles 20000 --enemies 200 --bullets 100
+'''
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from typing import Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame as pg
+
+from engine import game_play, headless, lib, settings, sprite as _sprite
+from engine.sprite import role_sprite
+from .levels import generate_level
+
+
+@dataclass
+class Scenario:
+    name: str
+    tiles: int
+    items: int
+    enemies: int
+    bullets: int
+    grenades: int
+    frames: int = 600
+    # numpy bullet arrays instead of bullet sprites
+    array_bullets: bool = True
+
+
+SCENARIOS = [
+    Scenario('tiles_1k', tiles=1000, items=50, enemies=10, bullets=20, grenades=2),
+    Scenario('tiles_10k', tiles=10000, items=500, enemies=100, bullets=100, grenades=5),
+    Scenario('tiles_50k', tiles=50000, items=2500, enemies=500, bullets=300, grenades=10),
+    Scenario('bullets_5k', tiles=1000, items=50, enemies=10, bullets=5000, grenades=2),
+]
+
+
+def _peak_memory_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+def _keep_projectiles(play: game_play.GamePlay,
+                      scenario: Scenario,
+                      rng: random.Random) -> None:
+    '''top up bullets and grenades around the view to the scenario count'''
+    view = play.metadata.camera.view_rect()
+    for _ in range(scenario.bullets - play.bullet_number()):
+        play.spawn_bullet(
+            pg.Vector2(rng.randrange(view.left, view.right), rng.randrange(100, 350)),
+            rng.choice((-1, 1)),
+            rng.choice((_sprite.RoleType.player, _sprite.RoleType.enemy))
+        )
+    for _ in range(scenario.grenades - play.grenade_number()):
+        play.spawn_grenade(
+            pg.Vector2(rng.randrange(view.left, view.right), 100),
+            rng.choice((-1, 1)),
+            _sprite.RoleType.player
+        )
+
+def run_scenario(scenario: Scenario) -> dict[str, object]:
+    rng = random.Random(0)
+    settings.ARRAY_BULLETS = scenario.array_bullets
+    load_start = time.perf_counter()
+    world_data = generate_level(scenario.tiles, scenario.items, scenario.enemies)
+    headless_game = headless.HeadlessGame(0, lib.DemoInput(), seed=0, world_data=world_data)
+    load_ms = (time.perf_counter() - load_start) * 1000
+    solid_tiles, colliders = headless_game.game_play.collider_counts()
+    frame_times: list[float] = []
+    ai_thoughts = 0
+    chunks_max = 0
+    for frame in range(scenario.frames):
+        _keep_projectiles(headless_game.game_play, scenario, rng)
+        update_ms, draw_ms = headless_game.step(frame)
+        frame_times.append(update_ms + draw_ms)
+        ai_thoughts += sum(headless_game.game_play.metadata.ai_scheduler.thoughts)
+        chunks_max = max(chunks_max, headless_game.game_play.chunk_counts()[0])
+    _, chunk_loads, chunk_releases = headless_game.game_play.chunk_counts()
+    headless_game.quit()
+    percentiles = statistics.quantiles(frame_times, n=100)
+    avg_frame = statistics.fmean(frame_times)
+    return {
+        'scenario': asdict(scenario),
+        'load_ms': round(load_ms, 3),
+        'colliders': {'tiles': solid_tiles, 'merged': colliders},
+        'chunks': {'loaded_max': chunks_max, 'loads': chunk_loads, 'releases': chunk_releases},
+        'fps': round(1000 / avg_frame, 1),
+        'frame_ms_avg': round(avg_frame, 3),
+        'frame_ms_p50': round(percentiles[49], 3),
+        'frame_ms_p95': round(percentiles[94], 3),
+        'frame_ms_p99': round(percentiles[98], 3),
+        'frame_ms_max': round(max(frame_times), 3),
+        'peak_memory_mb': _peak_memory_mb(),
+        'ai_thoughts_per_step': round(ai_thoughts / scenario.frames, 2),
+        'pools': {
+            'bullet': role_sprite.bullet_pool.stats(),
+            'grenade': role_sprite.grenade_pool.stats(),
+            'explode': role_sprite.explode_pool.stats()
+        }
+    }
+
+def run_isolated(scenario: Scenario) -> dict[str, object]:
+    '''run in a fresh process so peak memory belongs to this scenario only'''
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(run_scenario, scenario).result()
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scenario', action='append', default=None,
+                        choices=[s.name for s in SCENARIOS],
+                        help='preset scenarios to run, all of them by default')
+    parser.add_argument('--tiles', type=int, help='run one custom scenario instead')
+    parser.add_argument('--items', type=int, default=0)
+    parser.add_argument('--enemies', type=int, default=0)
+    parser.add_argument('--bullets', type=int, default=0)
+    parser.add_argument('--grenades', type=int, default=0)
+    parser.add_argument('--frames', type=int, default=None)
+    parser.add_argument('--sprite-bullets', action='store_true',
+                        help='run bullets as sprites even when numpy is installed')
+    parser.add_argument('--output', default=None, help='write the JSON report to this file')
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    if args.tiles is not None:
+        scenarios = [Scenario('custom', args.tiles, args.items, args.enemies,
+                              args.bullets, args.grenades)]
+    else:
+        names = args.scenario or [s.name for s in SCENARIOS]
+        scenarios = [s for s in SCENARIOS if s.name in names]
+    for scenario in scenarios:
+        if args.frames is not None:
+            scenario.frames = args.frames
+        scenario.array_bullets = not args.sprite_bullets
+    report = {
+        'update_rate': settings.UPDATE_RATE,
+        'results': [run_isolated(scenario) for scenario in scenarios]
+    }
+    report_json = json.dumps(report, indent=2)
+    if args.output is not None:
+        with open(args.output, 'w') as file_obj:
+            file_obj.write(report_json)
+    print(report_json)
+
+if __name__ == '__main__':
+    main()
@@ -8,60 +8,104 @@ from . import settings, game_start, game_editor, game_play, lib, ui
 
 class MainGame:
 
-    def __init__(self) -> None:
+    def __init__(self,
+                 record_path: typing.Optional[str] = None,
+                 profile_path: typing.Optional[str] = None) -> None:
         pg.init()
         self._screen = self._create_screen()
         self._clock = pg.time.Clock()
         self._game_metadata = lib.GameMetaData(
             game_mode=settings.GAME_START,
             level_edit_tile='',
-            scroll_value_x=0,
-            scroll_value_y=0,
-            shake_x=0,
-            shake_y=0,
             screen_shake=0,
             control_action=lib.com_type.ControlAction(),
-            scrren=self._screen
+            scrren=self._screen,
+            camera=lib.Camera(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT),
+            input_recorder=lib.InputRecorder() if record_path is not None else None
         )
+        self._record_path = record_path
         self._game_mode: dict[str, type[lib.GameManager]] = {
             settings.GAME_START: game_start.GameStart,
             settings.GAME_EDITOR: game_editor.GameEditor,
             settings.GAME_PLAY: game_play.GamePlay
         }
         self._game_manager: typing.Optional[lib.GameManager] = None
+        self._accumulator = 0.0
+        self._fps_tip = ui.Tip('', pg.Vector2(settings.SCREEN_WIDTH - 20, 25), 25, cached=False)
+        self._overlay_tip = ui.Tip('', pg.Vector2(settings.SCREEN_WIDTH - 20, 45), 25, cached=False)
+        self._profiler = self._game_metadata.profiler
+        self._profiler_overlay = ui.ProfilerOverlay(
+            self._profiler, pg.Vector2(10, 65))
+        self._show_profiler = False
+        if profile_path is not None:
+            self._profiler.open_csv(profile_path)
+            self._profiler.enabled = True
 
     def _create_screen(self) -> pg.surface.Surface:
         flag = pg.FULLSCREEN | pg.SCALED if settings.FULL_SCRREN else 0
         screen = pg.display.set_mode(
             (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), flag)
         pg.display.set_caption(settings.GAME_TITLE)
+        lib.assets.convert_all()
         return screen
 
     def _handle_input(self, key_event: pg.event.Event) -> None:
         if key_event.type == pg.QUIT:
             self._quit()
+        if lib.KeyMap(key_event).key_F3_press():
+            self._toggle_profiler()
         if self._game_manager is not None:
             self._game_manager.handle_input(key_event)
 
+    def _toggle_profiler(self) -> None:
+        self._show_profiler = not self._show_profiler
+        self._profiler.enabled = self._show_profiler or self._profiler.logging
+        self._profiler.reset()
+
     def _draw_fps(self) -> None:
         if not settings.SHOW_FPS:
             return
-        tip_obj = ui.Tip(
-            f'FPS:{round(self._clock.get_fps())}',
-            pg.Vector2(settings.SCREEN_WIDTH - 20, 25), 25)
-        tip_obj.draw(self._screen)
+        self._fps_tip.set_msg(f'FPS:{round(self._clock.get_fps())}')
+        self._fps_tip.draw(self._screen)
+        if self._game_manager is None:
+            return
+        overlay_info = self._game_manager.overlay_info()
+        if overlay_info:
+            self._overlay_tip.set_msg(overlay_info)
+            self._overlay_tip.draw(self._screen)
 
     def _draw(self) -> None:
         if self._game_manager is not None:
             self._game_manager.draw()
+        self._profiler.mark('draw')
         self._draw_fps()
+        if self._show_profiler:
+            self._profiler_overlay.draw(self._screen)
+        self._profiler.mark('overlay')
 
     def _update(self, dt: float) -> None:
         if self._game_manager is not None:
             self._game_manager.update(dt)
-        pg.display.update()
+        self._profiler.mark('update')
+
+    def _fixed_update(self) -> None:
+        '''run whole update steps for the time passed, blend the rest at draw'''
+        step = 1 / settings.UPDATE_RATE
+        self._accumulator += self._clock.get_time() / 1000
+        steps = 0
+        while self._accumulator >= step and steps < settings.MAX_CATCH_UP_STEPS:
+            self._update(step)
+            self._accumulator -= step
+            steps += 1
+        # too far behind, drop the backlog instead of falling further back
+        self._accumulator %= step
+        self._game_metadata.camera.alpha = self._accumulator / step
 
     def _quit(self) -> None:
+        recorder = self._game_metadata.input_recorder
+        if recorder is not None and self._record_path is not None and len(recorder) > 0:
+            recorder.write(self._record_path)
+        self._profiler.close_csv()
         pg.quit()
         sys.exit()
 
@@ -74,8 +118,16 @@ class MainGame:
                 if self._game_manager is not None:
                     del self._game_manager
                 self._game_manager = self._game_mode[switch_mode](self._game_metadata)
+            self._profiler.start_frame()
             for key_event in pg.event.get():
                 self._handle_input(key_event)
+            self._profiler.mark('events')
+            if settings.FIXED_TIMESTEP:
+                self._fixed_update()
+            else:
+                self._update(float(self._clock.get_time()/1000))
             self._draw()
-            self._update(float(self._clock.get_time()/1000))
+            pg.display.update()
+            self._profiler.mark('display')
+            self._profiler.end_frame()
             self._clock.tick(settings.FPS)
@@ -1,4 +1,3 @@
-import os
 from typing import Optional
 
 import pygame as pg
@@ -21,7 +20,7 @@ class GameEditor(lib.GameManager):
         self._background_lays = lib.com_fuc.pygame_load_images_list(settings.GAME_PLAY_BACK_IMG_PATH)
         self._background_lays_pos: list[pg.Vector2] = []
         self._grid_line: list[lib.com_type.Line] = []
-        self._tiles_button = ui.Button(pg.image.load(settings.TILES_BTN_IMG_PATH), pg.Vector2(20, 20), '')
+        self._tiles_button = ui.Button(lib.assets.load_image(settings.TILES_BTN_IMG_PATH), pg.Vector2(20, 20), '')
         self._tiles_images = lib.com_fuc.pygame_load_iamges_with_name(settings.TILES_IMG_PATH)
         self._item_images = lib.com_fuc.pygame_load_iamges_with_name(settings.ITEMS_IMG_PATH)
         self._sprite_images = lib.com_fuc.pygame_load_iamges_with_name(settings.SPRITE_IMG_PATH)
@@ -42,9 +41,12 @@ class GameEditor(lib.GameManager):
         self._holde_mouse_left = False
         self._holde_mouse_right = False
         self._surface_scroll_value = 0
-        self._world_data_path = os.path.join(settings.WORLD_DATA_PATH, f'{self._current_level}.pk')
-        self._world_data = lib.GameDataStruct.load_world_data(self._world_data_path)
+        self._world_data_path = lib.level_file.level_path(settings.WORLD_DATA_PATH,
+                                                          self._current_level)
+        self._world_data = lib.level_file.load_world_data(settings.WORLD_DATA_PATH,
+                                                          self._current_level)
         self._tip: dict[str, list[ui.Tip]] = {}
+        self._level_tip = ui.Tip('', pg.Vector2(settings.SCREEN_WIDTH - 20, 40), 25)
         self._init_content()
 
     def _init_content(self) -> None:
@@ -176,7 +178,7 @@ class GameEditor(lib.GameManager):
         elif key_map.key_back_press():
             self.metadata.game_mode = settings.GAME_START
         elif key_map.key_F1_press():
-            self._world_data.write_world_data(self._world_data_path)
+            lib.LevelData.from_world_data(self._world_data).write(self._world_data_path)
         self._set_tiles(key_event)
 
     def update(self, _) -> None:
@@ -227,9 +229,8 @@ class GameEditor(lib.GameManager):
             tip.draw(screen)
 
     def _draw_level_number(self, screen: pg.surface.Surface) -> None:
-        position = pg.Vector2(settings.SCREEN_WIDTH - 20, 40)
-        tip_obj = ui.Tip(f'current level:{self._current_level}', position, 25)
-        tip_obj.draw(screen)
+        self._level_tip.set_msg(f'current level:{self._current_level}')
+        self._level_tip.draw(screen)
 
     def draw(self) -> None:
         screen = self.metadata.scrren
@@ -1,5 +1,9 @@
-import os
+import hashlib
+import math
 import random
+import time
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, NamedTuple, Optional
 
 import pygame as pg
 
@@ -10,8 +14,31 @@ CONTINUE_MENU_LIST = [
     'Exit'
 ]
 
+
+class PreparedLevel(NamedTuple):
+    '''a level read and split into chunks, kept in memory while it is played
+
+    restarting the level starts again from here
+    '''
+    level: int
+    world_data: lib.LevelData
+    world_width: int
+    tile_grid: lib.TileGrid
+    level_stream: lib.LevelStream
+    background_positions: list[pg.Vector2]
+    # solid cells for the bullet array, None when bullets are sprites
+    bullet_tiles: Optional[Any]
+    # item and tile chunk surfaces baked when the level starts, per layer,
+    # filled by the first start
+    start_chunks: dict[str, dict[int, pg.surface.Surface]]
+
+
 class GamePlay(lib.GameManager):
-    def __init__(self, metadata: lib.GameMetaData) -> None:
+    def __init__(self,
+                 metadata: lib.GameMetaData,
+                 level: int = 0,
+                 seed: Optional[int] = None,
+                 world_data: Optional[lib.GameDataStruct] = None) -> None:
         super().__init__(metadata)
         self._background_lays = lib.com_fuc.pygame_load_images_list(
             settings.GAME_PLAY_BACK_IMG_PATH)
@@ -21,31 +48,91 @@ class GamePlay(lib.GameManager):
             settings.ITEMS_IMG_PATH)
         self._sprite_images = lib.com_fuc.pygame_load_iamges_with_name(
             settings.SPRITE_IMG_PATH)
+        self._death_fade = pg.surface.Surface(
+            (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pg.SRCALPHA)
+        self._death_fade.fill(settings.RGBA_BLACK)
+        self._bullet_image = lib.assets.load_image(settings.BULLET_IMG_PATH)
+        self._grenade_image = lib.assets.load_image(settings.GRENADE_IMG_PATH)
+        self._explode_image = lib.assets.load_image(settings.EXPLODE_IMG_PATH)
         self._layers_repets = 2
-        self._current_level = 0
-        self._game_init()
-
-    def _game_init(self) -> None:
-        self.metadata.control_action = lib.com_type.ControlAction()
-        self.metadata.GAME_OVER = False
-        self._background_lays_pos: list[pg.Vector2] = []
-        self._current_level = 0
-        self._grenade_number = 3
-        self._game_pause = False
-        self._world_data = lib.GameDataStruct.load_world_data(
-            os.path.join(settings.WORLD_DATA_PATH, f'{self._current_level}.pk')
-        )
+        self._current_level = level
+        self._start_level = level
+        self._seed = seed
+        # level data given directly instead of loaded from the level file
+        self._level_data = world_data
+        self._preloader: lib.LevelPreloader[PreparedLevel] = lib.LevelPreloader(
+            self._prepare_level, settings.PRELOAD_STEP_MS)
+        # level and ms of every switch to the next level
+        self.transitions: list[tuple[int, float]] = []
         self._player_sprites = pg.sprite.Group()
         self._enemy_sprites = pg.sprite.Group()
-        self._tile_sprites = pg.sprite.Group()
-        self._item_sprites = pg.sprite.Group()
         self._bullet_sprites = pg.sprite.Group()
         self._debug_sprites = pg.sprite.Group()
         self._grenade_sprites = pg.sprite.Group()
         self._explode_sprites = pg.sprite.Group()
+        self._bullet_array: Optional[lib.BulletArray] = None
+        if settings.ARRAY_BULLETS and lib.bullet_array.HAS_NUMPY:
+            self._bullet_array = lib.BulletArray(self._bullet_image, settings.TILE_SIZE)
+        self._combat = _sprite.CombatResolver(settings.COMBAT_CELL_SIZE)
+        self._game_init()
+
+    def _game_init(self,
+                   prepared: Optional[PreparedLevel] = None,
+                   new_run: bool = True) -> None:
+        self.metadata.control_action = lib.com_type.ControlAction()
+        self.metadata.GAME_OVER = False
+        self.metadata.screen_shake = 0
+        self.metadata.camera.reset()
+        if new_run:
+            # switching level keeps the rng and the recording going
+            self._init_rng()
+        if prepared is None:
+            prepared = self._preloader.take(self._current_level)
+        self._prepared = prepared
+        self._grenade_number = 3
+        self._game_pause = False
+        self._level_done = False
+        self._world_data = prepared.world_data
+        self._world_width = prepared.world_width
+        self._background_lays_pos = prepared.background_positions
+        self._exit_rect = pg.Rect(0, 0, 0, 0)
+        # projectiles of the last run go back to their pools
+        for group in (self._bullet_sprites, self._grenade_sprites, self._explode_sprites):
+            for s in group.sprites():
+                s.kill()
+        for group in (self._player_sprites, self._enemy_sprites, self._debug_sprites):
+            group.empty()
+        # items are drawn behind the player, tiles in front
+        self._chunk_layers = {
+            data_type: lib.TileChunks(
+                settings.TILE_CHUNK_COLUMNS * settings.TILE_SIZE[0],
+                settings.SCREEN_HEIGHT
+            )
+            for data_type in (settings.IMG_TYPE_ITEMS, settings.IMG_TYPE_TILES)
+        }
+        for data_type, chunks in self._chunk_layers.items():
+            chunks.restore(prepared.start_chunks.get(data_type, {}))
+        self._level_stream = prepared.level_stream
+        if self._bullet_array is not None:
+            self._bullet_array.clear()
+        self.metadata.bullet_array = self._bullet_array
+        self.metadata.vision.clear()
+        self.metadata.ai_scheduler.clear()
         self._continue_menu_list: list[ui.Menu] = []
         self._selected_continue_menu = 0
-        self._init_content()
+        self._active_sprites_number = 0
+        self._total_sprites_number = 0
+        # positions before the last update step, used to interpolate drawing
+        self._prev_positions: dict[pg.sprite.Sprite, tuple[int, int]] = {}
+        self._init_content(prepared)
+        self._preload_next_level()
+
+    def _init_rng(self) -> None:
+        seed = self._seed if self._seed is not None else random.randrange(2**32)
+        self.metadata.rng.seed(seed)
+        if self.metadata.input_recorder is not None:
+            self.metadata.input_recorder.start(
+                self._current_level, seed, settings.UPDATE_RATE)
 
     def _init_continue_menus(self) -> None:
         menu_size = 35
@@ -69,12 +156,10 @@ class GamePlay(lib.GameManager):
             player_sprite = _sprite.PlayerSprite(
                 settings.PLAYER1_IMG_PATH_MAP,
                 position,
-                self._tile_sprites,
                 self._bullet_sprites,
                 self._grenade_sprites,
                 self._explode_sprites,
-                self._background_lays_pos,
-                self._background_lays[-1].get_width(),
+                self._world_width,
                 self.metadata
             )
             self._player_sprites.add(player_sprite)
@@ -82,7 +167,6 @@ class GamePlay(lib.GameManager):
             enemy_sprite = _sprite.EnemySprite(
                 settings.ENEMY1_IMG_PATH_MAP,
                 position,
-                self._tile_sprites,
                 self._bullet_sprites,
                 self._player_sprites,
                 self._grenade_sprites,
@@ -91,47 +175,199 @@ class GamePlay(lib.GameManager):
             )
             self._enemy_sprites.add(enemy_sprite)
 
+    def _word_data_image(self, data_type: str, img: int) -> pg.surface.Surface:
+        tile_name = f'{data_type}_{img}.png'
+        if data_type == settings.IMG_TYPE_TILES:
+            return self._tiles_images[tile_name]
+        return self._item_images[tile_name]
+
     def _init_word_data(self,
                         data_type: str,
-                        datas_info: list[dict[str, int]]) -> None:
-        for data_info in datas_info:
-            x, y, img = data_info['x'], data_info['y'], data_info['img']
-            tile_name = f'{data_type}_{img}.png'
+                        datas_info: list[lib.level_file.Row]) -> list[pg.sprite.Sprite]:
+        '''tile and item sprites of some level rows, used to bake a chunk'''
+        static_sprites: list[pg.sprite.Sprite] = []
+        for x, y, img, flags in datas_info:
+            img_surface = self._word_data_image(data_type, img)
             position = pg.Vector2(
                 x * settings.TILE_SIZE[0],
                 y * settings.TILE_SIZE[1]
             )
             if data_type == settings.IMG_TYPE_TILES:
-                img_surface = self._tiles_images[tile_name]
-                collition = False if img in settings.NO_COLLITION_SPRITE else True
-                self._tile_sprites.add(
-                    _sprite.TileSprite(
-                        img_surface,
-                        position,
-                        self.metadata,
-                        collition
-                    )
-                )
-            elif data_type == settings.IMG_TYPE_SPRITES:
-                self._init_role_sprite(img, position)
+                collition = bool(flags & lib.level_file.FLAG_SOLID)
+                static_sprites.append(_sprite.TileSprite(
+                    img_surface,
+                    position,
+                    self.metadata,
+                    collition
+                ))
             elif data_type == settings.IMG_TYPE_ITEMS:
-                img_surface = self._item_images[tile_name]
-                self._item_sprites.add(_sprite.ItemSprite(
+                static_sprites.append(_sprite.ItemSprite(
                     img_surface, position, self.metadata))
+        return static_sprites
+
+    def _split_word_data(self,
+                         world_data: lib.LevelData,
+                         level_stream: lib.LevelStream) -> Iterator[None]:
+        '''hand level rows to the stream, the player is created up front instead'''
+        tile_width = settings.TILE_SIZE[0]
+        batch = settings.PRELOAD_BATCH
+        for data_type in (settings.IMG_TYPE_ITEMS, settings.IMG_TYPE_TILES):
+            widths: dict[int, int] = {}
+            for start in range(0, world_data.row_count(data_type), batch):
+                for row in world_data.rows(data_type, start, start + batch):
+                    x, img = row[0], row[2]
+                    width = widths.get(img)
+                    if width is None:
+                        width = widths[img] = self._word_data_image(data_type, img).get_width()
+                    level_stream.add(data_type, row, x * tile_width, x * tile_width + width)
+                yield
+        for start in range(0, world_data.row_count(settings.IMG_TYPE_SPRITES), batch):
+            for row in world_data.rows(settings.IMG_TYPE_SPRITES, start, start + batch):
+                x, img = row[0], row[2]
+                if img not in settings.PLAYER_TILES:
+                    level_stream.add(settings.IMG_TYPE_SPRITES, row,
+                                     x * tile_width, x * tile_width + 1)
+            yield
 
-    def _init_content(self) -> None:
-        # init background
+    def _prepare_level(self, level: int) -> Generator[None, None, PreparedLevel]:
+        '''read, decode and split a level, a batch of rows at a time
+
+        the next level is prepared a few ms every update step by the preloader
+        '''
+        if self._level_data is not None and level == self._start_level:
+            world_data = lib.LevelData.from_world_data(self._level_data)
+        else:
+            world_data = lib.level_file.load_level(settings.WORLD_DATA_PATH, level)
+        yield
+        batch = settings.PRELOAD_BATCH
+        # repeat the background for levels longer than the default
         last_layer_width = self._background_lays[-1].get_width()
-        self._background_lays_pos = [pg.Vector2(r * last_layer_width, i*80)
-                                     for r in range(self._layers_repets)
-                                     for i in range(len(self._background_lays))]
-        # init tiles and items
-        self._init_word_data(settings.IMG_TYPE_ITEMS,
-                             self._world_data.items_data)
-        self._init_word_data(settings.IMG_TYPE_TILES,
-                             self._world_data.tiles_data)
-        self._init_word_data(settings.IMG_TYPE_SPRITES,
-                             self._world_data.sprites_data)
+        tiles_width = world_data.columns() * settings.TILE_SIZE[0]
+        world_width = max(last_layer_width * self._layers_repets, tiles_width)
+        # solid cells for bullets and sight lines, merged into rects for roles
+        solid_cells: list[tuple[int, int]] = []
+        for start in range(0, world_data.row_count(settings.IMG_TYPE_TILES), batch):
+            solid_cells.extend(world_data.solid_cells(start, start + batch))
+            yield
+        tile_grid = lib.TileGrid(settings.TILE_SIZE)
+        yield from tile_grid.set_solid_steps(solid_cells, batch)
+        level_stream = lib.LevelStream(settings.TILE_CHUNK_COLUMNS * settings.TILE_SIZE[0],
+                                       settings.STREAM_MARGIN)
+        yield from self._split_word_data(world_data, level_stream)
+        yield from level_stream.sort_steps(batch)
+        level_stream.set_width(world_width)
+        layers_repets = math.ceil(world_width / last_layer_width)
+        background_positions: list[pg.Vector2] = []
+        for start in range(0, layers_repets, batch):
+            background_positions.extend(
+                pg.Vector2(r * last_layer_width, i*80)
+                for r in range(start, min(start + batch, layers_repets))
+                for i in range(len(self._background_lays)))
+            yield
+        bullet_tiles = None
+        if settings.ARRAY_BULLETS and lib.bullet_array.HAS_NUMPY:
+            bullet_tiles = yield from lib.bullet_array.tile_occupancy_steps(
+                solid_cells, batch)
+        return PreparedLevel(level, world_data, world_width, tile_grid, level_stream,
+                             background_positions, bullet_tiles, {})
+
+    def restart(self) -> None:
+        '''play the level again from the prepared level kept in memory'''
+        self._prepared.level_stream.reset()
+        self._game_init(self._prepared)
+
+    def _next_level_exists(self) -> bool:
+        next_level = self._current_level + 1
+        return (next_level <= settings.MAX_LEVEL
+                and lib.level_file.level_exists(settings.WORLD_DATA_PATH, next_level))
+
+    def _preload_next_level(self) -> None:
+        if settings.PRELOAD_NEXT_LEVEL and self._next_level_exists():
+            self._preloader.request(self._current_level + 1)
+
+    def _exit_reached(self) -> bool:
+        if self._level_done or self.metadata.GAME_OVER:
+            return False
+        return any(player.alive() and player.rect is not None
+                   and player.rect.colliderect(self._exit_rect)
+                   for player in self._player_sprites)
+
+    def _next_level(self) -> None:
+        '''switch to the next level, back to the start screen after the last one'''
+        self._level_done = True
+        if not self._next_level_exists():
+            self.metadata.game_mode = settings.GAME_START
+            return
+        start = time.perf_counter()
+        prepared = self._preloader.take(self._current_level + 1)
+        self._current_level = prepared.level
+        self._game_init(prepared, new_run=False)
+        self.transitions.append((prepared.level, (time.perf_counter() - start) * 1000))
+
+    def _load_chunk(self, index: int) -> None:
+        stream = self._level_stream
+        for data_type, chunks in self._chunk_layers.items():
+            # chunks restored from the prepared level are already baked
+            if index in chunks:
+                continue
+            static_sprites = self._init_word_data(data_type, stream.rows(index, data_type))
+            if static_sprites:
+                chunks.bake_chunk(index, static_sprites)
+        for x, y, img, _ in stream.take_rows(index, settings.IMG_TYPE_SPRITES):
+            self._init_role_sprite(img, pg.Vector2(x * settings.TILE_SIZE[0],
+                                                   y * settings.TILE_SIZE[1]))
+        self._enemy_sprites.add(*stream.unpark(index))
+
+    def _stream_chunks(self) -> None:
+        '''build chunks coming into range, release the ones left behind
+
+        enemies on a released chunk are parked with it, keeping their state,
+        dead ones are dropped
+        '''
+        stream = self._level_stream
+        load, release = stream.update(self.metadata.camera.view_rect())
+        if release:
+            for enemy in self._enemy_sprites.sprites():
+                if enemy.rect is None:
+                    continue
+                index = stream.chunk_index(enemy.rect.centerx)
+                if index not in release:
+                    continue
+                if enemy.is_empty_health():
+                    enemy.kill()
+                    continue
+                self._enemy_sprites.remove(enemy)
+                self.metadata.vision.forget(enemy)
+                self.metadata.ai_scheduler.forget(enemy)
+                stream.park(index, enemy)
+            for index in release:
+                for chunks in self._chunk_layers.values():
+                    chunks.release(index)
+        for index in load:
+            self._load_chunk(index)
+
+    def _init_content(self, prepared: PreparedLevel) -> None:
+        # the player is created now, tiles, items and enemies per chunk
+        # as the view nears them
+        tile_width, tile_height = settings.TILE_SIZE
+        for x, y, img, _ in self._world_data.rows(settings.IMG_TYPE_SPRITES):
+            if img in settings.PLAYER_TILES:
+                self._init_role_sprite(img, pg.Vector2(x * tile_width, y * tile_height))
+        # the exit is the last column unless the level names one
+        exit_column = self._world_data.level_info.get(settings.LEVEL_INFO_EXIT)
+        exit_x = (exit_column * tile_width if exit_column is not None
+                  else self._world_width - tile_width)
+        self._exit_rect = pg.Rect(exit_x, 0, tile_width, settings.SCREEN_HEIGHT)
+        self.metadata.tile_grid = prepared.tile_grid
+        if self._bullet_array is not None:
+            if prepared.bullet_tiles is not None:
+                self._bullet_array.set_occupancy(prepared.bullet_tiles)
+            else:
+                self._bullet_array.set_tiles(self.metadata.tile_grid.cells)
+        self._stream_chunks()
+        if not prepared.start_chunks:
+            prepared.start_chunks.update(
+                (data_type, chunks.snapshot()) for data_type, chunks in self._chunk_layers.items())
         # init continue menu
         self._init_continue_menus()
 
@@ -159,7 +395,7 @@ class GamePlay(lib.GameManager):
         # for index, menu in enumerate(self._continue_menu_list):
         if key_map.key_enter_press():
             if CONTINUE_MENU_LIST[self._selected_continue_menu] == 'Restart':
-                self._game_init()
+                self.restart()
             elif CONTINUE_MENU_LIST[self._selected_continue_menu] == 'Exit':
                 self.metadata.game_mode = settings.GAME_START
         elif key_map.key_up_press():
@@ -180,40 +416,156 @@ class GamePlay(lib.GameManager):
         else:
             self.handle_input_player(key_map)
 
-    def _update_backgroud_scroll(self) -> None:
-        for index, background_vec in enumerate(self._background_lays_pos):
-            lay_index = index % len(self._background_lays)
-            background_vec.x += (self.metadata.scroll_value_x) * \
-                ((lay_index+1)/len(self._background_lays))
-            background_vec.y += self.metadata.scroll_value_y * \
-                ((lay_index+1)/len(self._background_lays))
-
     def _screen_shake_control(self) -> None:
         if self.metadata.screen_shake <= 0:
             self.metadata.screen_shake = 0
-            self.metadata.shake_x= 0
-            self.metadata.shake_y= 0
+            self.metadata.camera.shake.update(0, 0)
             return
         self.metadata.screen_shake -= 1
-        random_value = random.randint(0, 8) -4
-        self.metadata.shake_x = random_value
-        self.metadata.shake_y = random_value
+        random_value = self.metadata.rng.randint(0, 8) -4
+        self.metadata.camera.shake.update(random_value, random_value)
+
+    def _store_previous_positions(self, sprites: Iterable[pg.sprite.Sprite]) -> None:
+        for s in sprites:
+            if s.rect is not None:
+                self._prev_positions[s] = s.rect.topleft
 
     def update(self, dt: float) -> None:
-        self._screen_shake_control()
+        self.metadata.camera.store_previous()
+        self._prev_positions.clear()
         for index, menu in enumerate(self._continue_menu_list):
             menu.be_select = True if index == self._selected_continue_menu else False
             menu.update()
         if self._game_pause:
             return
-        self._tile_sprites.update(dt=dt)
-        self._item_sprites.update(dt=dt)
+        if self.metadata.input_recorder is not None:
+            self.metadata.input_recorder.record(self.metadata.control_action)
+        self._screen_shake_control()
+        profiler = self.metadata.profiler
+        profiler.mark('update.misc')
+        self._store_previous_positions(self._player_sprites)
         self._player_sprites.update(dt=dt)
-        self._enemy_sprites.update(dt=dt)
-        self._bullet_sprites.update(dt=dt)
-        self._grenade_sprites.update(dt=dt)
-        self._explode_sprites.update(dt=dt)
-        self._update_backgroud_scroll()
+        profiler.mark('update.player')
+        self._stream_chunks()
+        profiler.mark('update.stream')
+        self.metadata.vision.begin_tick(
+            (player.rect for player in self._player_sprites
+             if player.alive() and player.rect is not None),
+            self.metadata.tile_grid
+        )
+        self.metadata.ai_scheduler.begin_tick(self.metadata.camera.view_rect())
+        active_area = self.metadata.camera.view_rect().inflate(
+            settings.ACTIVATION_MARGIN*2, settings.ACTIVATION_MARGIN*2)
+        self._active_sprites_number = len(self._player_sprites)
+        self._total_sprites_number = len(self._player_sprites)
+        active: dict[str, list[pg.sprite.Sprite]] = {}
+        # bullets, grenades and explosions end themselves in update(), they
+        # never sleep or they would never end
+        for section, group, area in (('update.enemies', self._enemy_sprites, active_area),
+                                     ('update.bullets', self._bullet_sprites, None),
+                                     ('update.grenades', self._grenade_sprites, None),
+                                     ('update.explodes', self._explode_sprites, None)):
+            active[section] = self._update_active_sprites(group, area, dt)
+            if group is self._bullet_sprites and self._bullet_array is not None:
+                self._bullet_array.update(dt, self.metadata.camera.view_rect())
+            profiler.mark(section)
+        self._combat.resolve(
+            [*self._player_sprites, *active['update.enemies']],
+            active['update.bullets'],
+            self._bullet_array,
+            active['update.explodes']
+        )
+        profiler.mark('update.combat')
+        if self._exit_reached():
+            self._next_level()
+            profiler.mark('update.transition')
+        else:
+            self._preloader.step()
+            profiler.mark('update.preload')
+
+    def _update_active_sprites(self,
+                               group: pg.sprite.Group,
+                               active_area: Optional[pg.Rect],
+                               dt: float) -> list[pg.sprite.Sprite]:
+        '''update only sprites in the active area, the rest sleep, all without one'''
+        active_sprites = [s for s in group
+                          if s.rect is not None
+                          and (active_area is None or s.rect.colliderect(active_area))]
+        self._active_sprites_number += len(active_sprites)
+        self._total_sprites_number += len(group)
+        self._store_previous_positions(active_sprites)
+        for s in active_sprites:
+            s.update(dt=dt)
+        return [s for s in active_sprites if s.alive()]
+
+    def collider_counts(self) -> tuple[int, int]:
+        '''solid tiles in the level and the merged rects that replace them'''
+        tile_grid = self.metadata.tile_grid
+        return len(tile_grid.cells), len(tile_grid.collider_rects)
+
+    def chunk_counts(self) -> tuple[int, int, int]:
+        '''chunks loaded now, and chunks built and released so far'''
+        stream = self._level_stream
+        return len(stream.loaded), stream.loads, stream.releases
+
+    def bullet_number(self) -> int:
+        if self._bullet_array is not None:
+            return len(self._bullet_array)
+        return len(self._bullet_sprites)
+
+    def grenade_number(self) -> int:
+        return len(self._grenade_sprites)
+
+    def spawn_bullet(self, position: pg.Vector2, direction: int, role_type: _sprite.RoleType) -> None:
+        if self._bullet_array is not None:
+            self._bullet_array.spawn(int(position.x), int(position.y),
+                                     settings.BULLET_SPEED * direction,
+                                     role_type, settings.BULLET_LIFE_TIME)
+            return
+        self._bullet_sprites.add(_sprite.Bullet.create(
+            self.metadata,
+            self._bullet_image,
+            position,
+            pg.Vector2(direction, 0),
+            settings.BULLET_SPEED,
+            role_type,
+            settings.BULLET_LIFE_TIME
+        ))
+
+    def spawn_grenade(self, position: pg.Vector2, direction: int, role_type: _sprite.RoleType) -> None:
+        self._grenade_sprites.add(_sprite.Grenade.create(
+            self.metadata,
+            self._grenade_image,
+            self._explode_image,
+            position,
+            direction,
+            self._explode_sprites,
+            role_type
+        ))
+
+    def state_digest(self) -> str:
+        '''hash of the simulation state, equal digests mean equal runs'''
+        digest = hashlib.sha1()
+        for group in (self._player_sprites, self._enemy_sprites, self._level_stream.parked(),
+                      self._bullet_sprites, self._grenade_sprites, self._explode_sprites):
+            for s in group:
+                digest.update(repr((s.rect, getattr(s, 'health_value', 0))).encode())
+            if group is self._bullet_sprites and self._bullet_array is not None:
+                for bullet_rect in self._bullet_array.rects():
+                    digest.update(repr((bullet_rect, 0)).encode())
+        digest.update(repr(self.metadata.camera.position).encode())
+        return digest.hexdigest()
+
+    def overlay_info(self) -> str:
+        # enemies that thought this step, nearest interval first
+        thoughts = '/'.join(str(n) for n in self.metadata.ai_scheduler.thoughts)
+        switch = f' switch:{self.transitions[-1][1]:.1f}ms' if self.transitions else ''
+        return (f'level:{self._current_level}{switch}'
+                f' active:{self._active_sprites_number}/{self._total_sprites_number}'
+                f' hits:{self._combat.hits}/{self._combat.checks}'
+                f' sight:{self.metadata.vision.checks}'
+                f' ai:{thoughts}'
+                f' chunks:{len(self._level_stream.loaded)}')
 
     def _continue_menu(self, screen: pg.surface.Surface) -> None:
         for menu in self._continue_menu_list:
@@ -221,29 +573,64 @@ class GamePlay(lib.GameManager):
 
     def _draw_death_fade(self, screen: pg.surface.Surface) -> None:
         if self.metadata.GAME_OVER or self._game_pause:
-            sur = pg.surface.Surface(
-                (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pg.SRCALPHA)
-            sur.fill(settings.RGBA_BLACK)
-            screen.blit(sur, (0, 0))
+            screen.blit(self._death_fade, (0, 0))
             self._continue_menu(screen)
 
-    def draw(self) -> None:
-        screen = self.metadata.scrren
-        for index, lay_pos in enumerate(self._background_lays_pos):
-            lay = self._background_lays[index % len(self._background_lays)]
+    def _draw_background(self, screen: pg.surface.Surface) -> None:
+        camera = self.metadata.camera
+        camera_pos = camera.render_position()
+        lays_number = len(self._background_lays)
+        # only the repeats that can reach the screen, the slowest layer
+        # scrolls at 1/lays_number and the fastest with the camera
+        repet_width = self._background_lays[-1].get_width()
+        widest = max(lay.get_width() for lay in self._background_lays)
+        first = max(int((camera_pos.x / lays_number - camera.shake.x - widest) // repet_width), 0)
+        last = int((camera_pos.x - camera.shake.x + settings.SCREEN_WIDTH) // repet_width)
+        visible = self._background_lays_pos[first*lays_number:(last+1)*lays_number]
+        for index, lay_pos in enumerate(visible):
+            lay_index = index % lays_number
+            # farther layers scroll slower
+            scroll_rate = (lay_index+1) / lays_number
             new_lay_pos = pg.Vector2(
-                lay_pos.x + self.metadata.shake_x,
-                lay_pos.y + self.metadata.shake_y
+                lay_pos.x - camera_pos.x * scroll_rate + camera.shake.x,
+                lay_pos.y - camera_pos.y * scroll_rate + camera.shake.y
             )
+            lay = self._background_lays[lay_index]
+            if new_lay_pos.x >= settings.SCREEN_WIDTH or new_lay_pos.x + lay.get_width() <= 0:
+                continue
             screen.blit(lay, new_lay_pos)
-        self._item_sprites.draw(screen)
-        self._player_sprites.draw(screen)
-        self._tile_sprites.draw(screen)
-        self._enemy_sprites.draw(screen)
-        self._bullet_sprites.draw(screen)
-        self._grenade_sprites.draw(screen)
-        self._explode_sprites.draw(screen)
+
+    def draw(self) -> None:
+        screen = self.metadata.scrren
+        camera = self.metadata.camera
+        profiler = self.metadata.profiler
+        self._draw_background(screen)
+        profiler.mark('draw.background')
+        self._chunk_layers[settings.IMG_TYPE_ITEMS].draw(screen, camera)
+        profiler.mark('draw.items')
+        camera.draw_sprites(screen, self._player_sprites, self._prev_positions)
+        profiler.mark('draw.player')
+        self._chunk_layers[settings.IMG_TYPE_TILES].draw(screen, camera)
+        profiler.mark('draw.tiles')
+        camera.draw_sprites(screen, self._enemy_sprites, self._prev_positions)
+        profiler.mark('draw.enemies')
+        camera.draw_sprites(screen, self._bullet_sprites, self._prev_positions)
+        if self._bullet_array is not None:
+            self._bullet_array.draw(screen, camera)
+        profiler.mark('draw.bullets')
+        camera.draw_sprites(screen, self._grenade_sprites, self._prev_positions)
+        profiler.mark('draw.grenades')
+        camera.draw_sprites(screen, self._explode_sprites)
+        profiler.mark('draw.explodes')
+        self._draw_hud()
         self._draw_death_fade(screen)
+        profiler.mark('draw.hud')
+
+    def _draw_hud(self) -> None:
+        for enemy in self._enemy_sprites:
+            enemy.draw_detected_symbol()
+        for player in self._player_sprites:
+            player.hud()
 
     def clear(self, screen: pg.surface.Surface) -> None:
         screen.fill(settings.RGB_BLACK)
@@ -32,11 +32,11 @@ class GameStart(lib.GameManager):
     def _load_content(self) -> None:
         # load background lays
         for lay in range(self._lay_number):
-            lay_img = pg.image.load(os.path.join(settings.GAME_START_IMG_PATH, f'layer{lay}.png'))
+            lay_img = lib.assets.load_image(os.path.join(settings.GAME_START_IMG_PATH, f'layer{lay}.png'))
             self._background_lays.append(lay_img)
         # load clouds
         for lay in range(self._cloud_number):
-            cloud_img = pg.image.load(os.path.join(settings.GAME_START_IMG_PATH, f'cloud_layer{lay}.png')).convert_alpha()
+            cloud_img = lib.assets.load_image(os.path.join(settings.GAME_START_IMG_PATH, f'cloud_layer{lay}.png'))
             cloud_sprite = _sprite.CloudSprite(cloud_img, pg.Vector2(0,0), self._cloud_number*3 - lay*3)
             self.cloud_sprites.add(cloud_sprite)
         # load menu
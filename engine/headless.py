@@ -0,0 +1,109 @@
+import os
+import time
+from typing import Optional
+
+import pygame as pg
+
+from . import settings, game_play, lib, ui
+
+
+class HeadlessGame:
+    '''run GamePlay without a window, the player is driven by an input source'''
+    def __init__(self,
+                 level: int,
+                 input_source: lib.InputSource,
+                 seed: Optional[int] = None,
+                 input_recorder: Optional[lib.InputRecorder] = None,
+                 world_data: Optional[lib.GameDataStruct] = None) -> None:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pg.init()
+        self._screen = pg.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        lib.assets.convert_all()
+        self._metadata = lib.GameMetaData(
+            game_mode=settings.GAME_PLAY,
+            level_edit_tile='',
+            screen_shake=0,
+            control_action=lib.com_type.ControlAction(),
+            scrren=self._screen,
+            camera=lib.Camera(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT),
+            input_recorder=input_recorder
+        )
+        self._input_source = input_source
+        self.game_play = game_play.GamePlay(self._metadata, level, seed, world_data)
+
+    def step(self, frame: int) -> tuple[float, float]:
+        '''one fixed update and one draw, returns their time in ms'''
+        self._input_source.apply(frame, self._metadata.control_action)
+        start = time.perf_counter()
+        self.game_play.update(1 / settings.UPDATE_RATE)
+        update_done = time.perf_counter()
+        self.game_play.draw()
+        draw_done = time.perf_counter()
+        return (update_done - start) * 1000, (draw_done - update_done) * 1000
+
+    def run(self, frames: int, print_frames: bool = True) -> list[tuple[float, float]]:
+        timings: list[tuple[float, float]] = []
+        if print_frames:
+            print('frame,update_ms,draw_ms')
+        for frame in range(frames):
+            update_ms, draw_ms = self.step(frame)
+            timings.append((update_ms, draw_ms))
+            if print_frames:
+                print(f'{frame},{update_ms:.3f},{draw_ms:.3f}')
+        return timings
+
+    def quit(self) -> None:
+        ui.text_cache.clear()
+        pg.quit()
+
+
+def print_summary(timings: list[tuple[float, float]]) -> None:
+    if not timings:
+        return
+    update_times = [t[0] for t in timings]
+    draw_times = [t[1] for t in timings]
+    frame_times = [u + d for u, d in timings]
+    avg_frame = sum(frame_times) / len(frame_times)
+    print(f'frames: {len(timings)}')
+    print(f'update ms avg/max: {sum(update_times)/len(update_times):.3f}/{max(update_times):.3f}')
+    print(f'draw ms avg/max: {sum(draw_times)/len(draw_times):.3f}/{max(draw_times):.3f}')
+    print(f'frame ms avg/max: {avg_frame:.3f}/{max(frame_times):.3f}'
+          f' ({1000/avg_frame if avg_frame else 0:.0f} fps)')
+
+def run(level: int,
+        frames: Optional[int] = None,
+        input_path: Optional[str] = None,
+        print_frames: bool = True,
+        seed: Optional[int] = None,
+        replay_path: Optional[str] = None,
+        record_path: Optional[str] = None) -> None:
+    input_source: lib.InputSource
+    if replay_path is not None:
+        replay = lib.InputReplay.load(replay_path)
+        if replay.update_rate != settings.UPDATE_RATE:
+            print(f'warning: recorded at {replay.update_rate}Hz, '
+                  f'running at {settings.UPDATE_RATE}Hz')
+        level, seed = replay.level, replay.seed
+        frames = len(replay) if frames is None else frames
+        input_source = replay
+    elif input_path is not None:
+        input_source = lib.InputScript.load(input_path)
+    else:
+        input_source = lib.DemoInput()
+    input_recorder = lib.InputRecorder() if record_path is not None else None
+    headless_game = HeadlessGame(level, input_source, seed, input_recorder)
+    timings = headless_game.run(600 if frames is None else frames, print_frames)
+    state_digest = headless_game.game_play.state_digest()
+    solid_tiles, colliders = headless_game.game_play.collider_counts()
+    transitions = headless_game.game_play.transitions
+    asset_stats = lib.assets.stats()
+    headless_game.quit()
+    if input_recorder is not None and record_path is not None:
+        input_recorder.write(record_path)
+    print_summary(timings)
+    print(f'colliders: {solid_tiles} tiles merged into {colliders} rects')
+    print(f'assets: {asset_stats["images"]} images, '
+          f'{asset_stats["hits"]} hits, {asset_stats["misses"]} misses')
+    for level, transition_ms in transitions:
+        print(f'switched to level {level} in {transition_ms:.3f} ms')
+    print(f'state: {state_digest}')
@@ -1,9 +1,29 @@
-from . import game_manager, common_func, common_type, key_map, game_data
+from . import game_manager, common_func, common_type, key_map, game_data, asset_cache, camera, tile_chunks, input_script, input_record, profiler, object_pool, bullet_array, spatial_hash, tile_grid, vision, ai_scheduler, level_file, level_stream, level_preload
 
 GameManager = game_manager.GameManager
 GameMetaData = game_data.GameMetaData
 GameDataStruct = game_data.GameDataStruct
 KeyMap = key_map.KeyMap
+AssetCache = asset_cache.AssetCache
+Camera = camera.Camera
+TileChunks = tile_chunks.TileChunks
+InputSource = input_script.InputSource
+InputScript = input_script.InputScript
+DemoInput = input_script.DemoInput
+InputRecorder = input_record.InputRecorder
+InputReplay = input_record.InputReplay
+FrameProfiler = profiler.FrameProfiler
+ObjectPool = object_pool.ObjectPool
+BulletArray = bullet_array.BulletArray
+SpatialHash = spatial_hash.SpatialHash
+TileGrid = tile_grid.TileGrid
+RayHit = tile_grid.RayHit
+Vision = vision.Vision
+AIScheduler = ai_scheduler.AIScheduler
+LevelData = level_file.LevelData
+LevelStream = level_stream.LevelStream
+LevelPreloader = level_preload.LevelPreloader
+assets = asset_cache.assets
 
 com_fuc = common_func
 com_type = common_type
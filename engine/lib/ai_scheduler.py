@@ -0,0 +1,60 @@
+from pygame import Rect, sprite
+
+
+class AIScheduler:
+    '''decide which agents think this step from how far they are from the view
+
+    intervals is a list of (max distance, think every n steps), nearest first;
+    agents farther than the last entry do not think. agents with the same
+    interval think on different steps so the work is spread out
+    '''
+    def __init__(self, intervals: tuple[tuple[int, int], ...]) -> None:
+        self.intervals = intervals
+        # agents frozen for longer do not catch up on the time they missed
+        self._max_steps = max((every for _, every in intervals), default=1)
+        self._tick = 0
+        self._view = Rect(0, 0, 0, 0)
+        # think slot and last think step of every agent, kept until forget()
+        self._next_slot = 0
+        self._agents: dict[sprite.Sprite, list[int]] = {}
+        # agents that thought this step, per interval entry, and that waited
+        self.thoughts = [0] * len(intervals)
+        self.waiting = 0
+
+    def clear(self) -> None:
+        self._tick = 0
+        self._next_slot = 0
+        self._agents.clear()
+
+    def forget(self, agent: sprite.Sprite) -> None:
+        '''drop an agent that is gone or parked, it starts over if it thinks again'''
+        self._agents.pop(agent, None)
+
+    def begin_tick(self, view: Rect) -> None:
+        self._tick += 1
+        self._view = view
+        self.thoughts = [0] * len(self.intervals)
+        self.waiting = 0
+
+    def think_steps(self, agent: sprite.Sprite, area: Rect) -> int:
+        '''steps since the agent last thought when it should think now, otherwise 0'''
+        view = self._view
+        distance = max(view.left - area.right, area.left - view.right,
+                       view.top - area.bottom, area.top - view.bottom, 0)
+        state = self._agents.get(agent)
+        if state is None:
+            state = self._agents[agent] = [self._next_slot, self._tick - 1]
+            self._next_slot += 1
+        slot, last_think = state
+        for index, (max_distance, every) in enumerate(self.intervals):
+            if distance <= max_distance:
+                break
+        else:
+            self.waiting += 1
+            return 0
+        if (slot + self._tick) % every != 0:
+            self.waiting += 1
+            return 0
+        state[1] = self._tick
+        self.thoughts[index] += 1
+        return min(self._tick - last_think, self._max_steps)
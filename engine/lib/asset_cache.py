@@ -0,0 +1,54 @@
+from pygame import display, image, mask, surface, SRCALPHA
+
+
+def _has_transparency(img: surface.Surface) -> bool:
+    if not img.get_flags() & SRCALPHA:
+        return False
+    opaque_pixels = mask.from_surface(img, 254).count()
+    return opaque_pixels < img.get_width() * img.get_height()
+
+def convert_to_display(img: surface.Surface) -> surface.Surface:
+    '''convert to the display pixel format, keep alpha only if it is used'''
+    if display.get_surface() is None:
+        return img
+    if _has_transparency(img):
+        return img.convert_alpha()
+    return img.convert()
+
+
+class AssetCache:
+    '''load every asset file once and share the loaded surface'''
+    def __init__(self) -> None:
+        self._images: dict[str, surface.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load_image(self, path: str) -> surface.Surface:
+        img = self._images.get(path)
+        if img is not None:
+            self.hits += 1
+            return img
+        self.misses += 1
+        img = convert_to_display(image.load(path))
+        self._images[path] = img
+        return img
+
+    def convert_all(self) -> None:
+        '''convert images cached before the display was created'''
+        for path, img in self._images.items():
+            self._images[path] = convert_to_display(img)
+
+    def clear(self) -> None:
+        self._images.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'images': len(self._images),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+assets = AssetCache()
@@ -0,0 +1,217 @@
+from collections.abc import Generator, Iterable
+from enum import Enum
+from itertools import chain, islice
+from typing import Any
+
+from pygame import Rect, surface
+
+from .camera import Camera
+from .common_func import run_steps
+
+try:
+    import numpy as np
+except ImportError:  # optional, bullets stay sprites without it
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def tile_occupancy_steps(cells: Iterable[tuple[int, int]],
+                         batch: int) -> Generator[None, None, Any]:
+    '''tile_occupancy pausing after every batch cells'''
+    if np is None:
+        raise RuntimeError('tile_occupancy needs numpy')
+    parts = []
+    cell_iter = iter(cells)
+    while part := list(islice(cell_iter, batch)):
+        parts.append(np.fromiter(chain.from_iterable(part), dtype=np.int64, count=len(part) * 2))
+        yield
+    if not parts:
+        return np.zeros((0, 0), dtype=bool)
+    columns = max(int(part[0::2].max()) for part in parts) + 1
+    rows = max(int(part[1::2].max()) for part in parts) + 1
+    occupancy = np.zeros((columns, rows), dtype=bool)
+    for part in parts:
+        occupancy[part[0::2], part[1::2]] = True
+        yield
+    return occupancy
+
+def tile_occupancy(cells: Iterable[tuple[int, int]]) -> Any:
+    '''solid cells as a bool grid indexed [column, row]'''
+    return run_steps(tile_occupancy_steps(cells, 4096))
+
+
+class BulletArray:
+    '''bullets as parallel arrays, moved, expired and tile tested in batches'''
+    def __init__(self,
+                 image: surface.Surface,
+                 tile_size: tuple[int, int],
+                 capacity: int = 256) -> None:
+        if np is None:
+            raise RuntimeError('BulletArray needs numpy')
+        self._image = image
+        self._width, self._height = image.get_size()
+        self._tile_width, self._tile_height = tile_size
+        self._occupancy = np.zeros((0, 0), dtype=bool)
+        self._count = 0
+        self._order = np.zeros(0, dtype=np.int64)
+        self._sorted_x = np.zeros(0, dtype=np.int32)
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.prev_x = np.zeros(capacity, dtype=np.int32)
+        # pixels per second, the sign is the direction
+        self.velocity = np.zeros(capacity, dtype=np.float64)
+        self.owner = np.zeros(capacity, dtype=np.int16)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.life_time = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # stopped by a tile, still hits roles on the way there and dies next step
+        self.spent = np.zeros(capacity, dtype=bool)
+        # farthest any bullet moved in the last step, widens overlapping() searches
+        self._max_travel = 0
+
+    def _fields(self) -> tuple[Any, ...]:
+        return (self.x, self.y, self.prev_x, self.velocity,
+                self.owner, self.age, self.life_time, self.alive, self.spent)
+
+    def _grow(self) -> None:
+        self.x, self.y, self.prev_x, self.velocity, \
+            self.owner, self.age, self.life_time, self.alive, self.spent = (
+                np.concatenate((arr, np.zeros_like(arr))) for arr in self._fields())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive[:self._count]))
+
+    def set_tiles(self, cells: Iterable[tuple[int, int]]) -> None:
+        '''mark the solid cells that stop bullets'''
+        self._occupancy = tile_occupancy(cells)
+
+    def set_occupancy(self, occupancy: Any) -> None:
+        '''use a grid made by tile_occupancy ahead of time'''
+        self._occupancy = occupancy
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def spawn(self, x: int, y: int, velocity: float, owner: Enum, life_time: int) -> None:
+        if self._count == len(self.x):
+            self._compact()
+        if self._count == len(self.x):
+            self._grow()
+        i = self._count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = y
+        self.velocity[i] = velocity
+        self.owner[i] = owner.value
+        self.age[i] = 0
+        self.life_time[i] = life_time
+        self.alive[i] = True
+        self.spent[i] = False
+        self._count += 1
+
+    def _compact(self) -> None:
+        '''drop dead bullets, keeping spawn order'''
+        keep = np.flatnonzero(self.alive[:self._count])
+        if len(keep) == self._count:
+            return
+        for arr in self._fields():
+            arr[:len(keep)] = arr[keep]
+        self._count = len(keep)
+
+    def _sweep_tiles(self, start_x: Any, x: Any, y: Any) -> tuple[Any, Any]:
+        '''bullets that cross a solid cell moving from start_x to x, and where they stop
+
+        only the columns between the trailing edge at the start and the leading
+        edge at the end are visited, a few steps for every bullet at once
+        '''
+        tile_width, tile_height = self._tile_width, self._tile_height
+        cols_count, rows_count = self._occupancy.shape
+        forward = x > start_x
+        first = np.where(forward, start_x, start_x + self._width - 1) // tile_width
+        last = np.where(forward, x + self._width - 1, x) // tile_width
+        step = np.where(forward, 1, -1)
+        steps = (last - first) * step
+        hit = np.zeros(len(x), dtype=bool)
+        hit_col = np.zeros(len(x), dtype=np.int32)
+        # bullets are smaller than a tile, so two rows cover every cell they touch
+        rows = (y // tile_height, (y + self._height - 1) // tile_height)
+        for k in range(int(steps.max()) + 1 if len(x) else 0):
+            col = first + step * k
+            pending = ~hit & (k <= steps) & (col >= 0) & (col < cols_count)
+            for row in rows:
+                check = pending & (row >= 0) & (row < rows_count)
+                solid = np.zeros(len(x), dtype=bool)
+                solid[check] = self._occupancy[col[check], row[check]]
+                hit_col[solid] = col[solid]
+                hit |= solid
+                pending &= ~solid
+        # stop against the tile, or stay put when already touching it
+        tile_left = hit_col * tile_width
+        stop = np.where(forward,
+                        np.maximum(start_x, np.minimum(x, tile_left - self._width)),
+                        np.minimum(start_x, np.maximum(x, tile_left + tile_width)))
+        return hit, stop
+
+    def update(self, dt: float, view: Rect) -> None:
+        # bullets stopped by a tile had their last step to hit roles
+        self.alive[:self._count] &= ~self.spent[:self._count]
+        self._compact()
+        n = self._count
+        x = self.x[:n]
+        self.prev_x[:n] = x
+        self.age[:n] += 1
+        x += np.round(dt * self.velocity[:n]).astype(np.int32)
+        hit, stop = self._sweep_tiles(self.prev_x[:n], x, self.y[:n])
+        x[hit] = stop[hit]
+        self.spent[:n] |= hit
+        expired = ((x + self._width < view.left - 50)
+                   | (x > view.right + 50)
+                   | (self.age[:n] > self.life_time[:n]))
+        self.alive[:n] &= ~expired
+
+    def build_index(self) -> None:
+        '''sort live bullets by x so overlapping() can binary search them'''
+        self._compact()
+        x = self.x[:self._count]
+        self._order = np.argsort(x, kind='stable')
+        self._sorted_x = x[self._order]
+        travel = np.abs(x - self.prev_x[:self._count])
+        self._max_travel = int(travel.max()) if len(travel) else 0
+
+    def overlapping(self, area: Rect, role: Enum) -> Any:
+        '''indices of live bullets not shot by role whose last step swept area, in spawn order'''
+        low = np.searchsorted(self._sorted_x, area.left - self._width + 1 - self._max_travel, 'left')
+        high = np.searchsorted(self._sorted_x, area.right + self._max_travel, 'left')
+        indices = np.sort(self._order[low:high])
+        x, prev_x, y = self.x[indices], self.prev_x[indices], self.y[indices]
+        hit = (self.alive[indices]
+               & (self.owner[indices] != role.value)
+               & (np.minimum(x, prev_x) < area.right)
+               & (np.maximum(x, prev_x) + self._width > area.left)
+               & (y < area.bottom) & (y + self._height > area.top))
+        return indices[hit]
+
+    def kill(self, indices: Any) -> None:
+        self.alive[indices] = False
+
+    def rects(self) -> list[Rect]:
+        n = self._count
+        alive = self.alive[:n]
+        return [Rect(x, y, self._width, self._height)
+                for x, y in zip(self.x[:n][alive].tolist(), self.y[:n][alive].tolist())]
+
+    def draw(self, screen: surface.Surface, camera: Camera) -> None:
+        n = self._count
+        view = camera.render_rect()
+        x, y = self.x[:n], self.y[:n]
+        visible = (self.alive[:n]
+                   & (x < view.right) & (x + self._width > view.left)
+                   & (y < view.bottom) & (y + self._height > view.top))
+        if not visible.any():
+            return
+        offset = camera.render_offset()
+        prev_x = self.prev_x[:n][visible]
+        draw_x = (prev_x + (x[visible] - prev_x) * camera.alpha + offset.x).astype(np.int32)
+        draw_y = (y[visible] + offset.y).astype(np.int32)
+        image = self._image
+        screen.blits([(image, pos) for pos in zip(draw_x.tolist(), draw_y.tolist())], False)
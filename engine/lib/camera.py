@@ -0,0 +1,73 @@
+import math
+from collections.abc import Iterable, Mapping
+from typing import Optional
+
+from pygame import Rect, Vector2, sprite, surface
+
+
+class Camera:
+    '''view of the world, sprites stay in world position and are offset at draw time'''
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.position = Vector2(0, 0)
+        self.shake = Vector2(0, 0)
+        # position before the last update step and how far to blend
+        # from it when rendering
+        self.prev_position = Vector2(0, 0)
+        self.alpha = 1.0
+
+    def reset(self) -> None:
+        self.position.update(0, 0)
+        self.prev_position.update(0, 0)
+        self.shake.update(0, 0)
+
+    def store_previous(self) -> None:
+        self.prev_position.update(self.position)
+
+    def view_rect(self) -> Rect:
+        return Rect(int(self.position.x), int(self.position.y), self.width, self.height)
+
+    def render_rect(self) -> Rect:
+        '''world area drawn this frame, the view at the render position moved by the shake'''
+        position = self.render_position()
+        return Rect(int(position.x), int(position.y), self.width, self.height).inflate(
+            2*math.ceil(abs(self.shake.x)) + 2, 2*math.ceil(abs(self.shake.y)) + 2)
+
+    def render_position(self) -> Vector2:
+        return self.prev_position.lerp(self.position, self.alpha)
+
+    def render_offset(self) -> Vector2:
+        return self.shake - self.render_position()
+
+    def follow(self, target: Rect, world_width: int) -> None:
+        '''scroll forward once the target passes the middle of the view'''
+        max_x = max(world_width - self.width, 0)
+        x = max(self.position.x, target.x - self.width//2)
+        self.position.x = min(x, max_x)
+
+    def apply(self, world_rect: Rect) -> Rect:
+        offset = self.render_offset()
+        return world_rect.move(int(offset.x), int(offset.y))
+
+    def apply_point(self, world_pos: Vector2) -> Vector2:
+        return world_pos + self.render_offset()
+
+    def draw_sprites(self,
+                     screen: surface.Surface,
+                     sprites: Iterable[sprite.Sprite],
+                     prev_positions: Optional[Mapping[sprite.Sprite, tuple[int, int]]] = None) -> None:
+        '''draw sprites in view, blending from prev_positions when given'''
+        view = self.render_rect()
+        offset = self.render_offset()
+        blits: list[tuple[surface.Surface, tuple[int, int]]] = []
+        for s in sprites:
+            if s.image is None or s.rect is None or not s.rect.colliderect(view):
+                continue
+            x, y = s.rect.topleft
+            prev = prev_positions.get(s) if prev_positions is not None else None
+            if prev is not None:
+                x = prev[0] + (x - prev[0]) * self.alpha
+                y = prev[1] + (y - prev[1]) * self.alpha
+            blits.append((s.image, (int(x + offset.x), int(y + offset.y))))
+        screen.blits(blits, False)
@@ -1,6 +1,12 @@
 import os
+from collections.abc import Generator
+from typing import TypeVar
 
-from pygame import image, surface
+from pygame import surface
+
+from .asset_cache import assets
+
+T = TypeVar('T')
 
 def listdir_clean(path: str) -> list[str]:
    files = os.listdir(path)
@@ -9,10 +15,18 @@ def listdir_clean(path: str) -> list[str]:
 
 def pygame_load_images_list(path: str) -> list[surface.Surface]:
     file_list = listdir_clean(path)
-    return [ image.load(os.path.join(path, file)) for file in file_list]
+    return [ assets.load_image(os.path.join(path, file)) for file in file_list]
 
 def pygame_load_iamges_with_name(path: str) -> dict[str, surface.Surface]:
     folder_name = path.split('/')[-1]
     file_list = listdir_clean(path)
-    return {f'{folder_name}_{file}': image.load(os.path.join(path, file)) for file in file_list}
+    return {f'{folder_name}_{file}': assets.load_image(os.path.join(path, file)) for file in file_list}
+
 
+def run_steps(work: Generator[None, None, T]) -> T:
+    '''run work that pauses between steps to the end, returns its result'''
+    while True:
+        try:
+            next(work)
+        except StopIteration as done:
+            return done.value
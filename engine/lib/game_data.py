@@ -1,25 +1,41 @@
 import os
 import pickle
-from dataclasses import dataclass
-from typing import Optional
+import random
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from pygame import surface
 
 from .. import settings
 from .common_type import ControlAction
+from .ai_scheduler import AIScheduler
+from .bullet_array import BulletArray
+from .camera import Camera
+from .input_record import InputRecorder
+from .profiler import FrameProfiler
+from .tile_grid import TileGrid
+from .vision import Vision
 
 @dataclass
 class GameMetaData:
     game_mode: str
     level_edit_tile: str
-    scroll_value_x: int
-    scroll_value_y: int
     screen_shake: int
-    shake_x: int
-    shake_y: int
     control_action: ControlAction
     scrren: surface.Surface
+    camera: Camera
     GAME_OVER: bool = False
+    # all game randomness goes through rng so a seeded run can be replayed
+    rng: random.Random = field(default_factory=random.Random)
+    input_recorder: Optional[InputRecorder] = None
+    profiler: FrameProfiler = field(default_factory=FrameProfiler)
+    # set by game play when bullets run as arrays instead of sprites
+    bullet_array: Optional[BulletArray] = None
+    # solid cells of the current level for raycasts
+    tile_grid: TileGrid = field(default_factory=lambda: TileGrid(settings.TILE_SIZE))
+    vision: Vision = field(default_factory=lambda: Vision(settings.VISION_CHECKS_PER_TICK))
+    ai_scheduler: AIScheduler = field(
+        default_factory=lambda: AIScheduler(settings.AI_THINK_INTERVALS))
 
 @dataclass
 class GameDataStruct:
@@ -29,42 +45,57 @@ class GameDataStruct:
     collition_data: dict[str, list[int]]
     level_info: dict[str, int]
 
+    def __post_init__(self) -> None:
+        self._build_index()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the index is rebuilt on load, so level files keep their old layout
+        state = self.__dict__.copy()
+        state.pop('_index', None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        '''map each layer's (x, y) to its place in the layer list'''
+        self._index: dict[str, dict[tuple[int, int], int]] = {}
+        for img_type, imgs_list in self._get_all_tiles_info().items():
+            positions: dict[tuple[int, int], dict[str, int]] = {}
+            # one image per position, the last one wins like when painting
+            for img in imgs_list:
+                positions[(img['x'], img['y'])] = img
+            if len(positions) != len(imgs_list):
+                imgs_list[:] = positions.values()
+            self._index[img_type] = {pos: index for index, pos in enumerate(positions)}
+
     def delete_tile_by_pos(self, x: int, y: int) -> None:
-        all_imgs_info = self._get_all_tiles_info()
-        flag = False
-        tile_type = ''
-        tile = 0
-        for t_type, tiles in all_imgs_info.items():
-            for tile_index, tile_info in enumerate(tiles):
-                if tile_info['x'] == x and tile_info['y'] == y:
-                    flag = True
-                    tile_type = t_type
-                    tile = tile_index
-                if flag:
-                    del all_imgs_info[tile_type][tile]
-                    return
+        for img_type, positions in self._index.items():
+            if (x, y) in positions:
+                self._delete_tile_by_pos_with_type(x, y, img_type)
+                return
 
     def _delete_tile_by_pos_with_type(self, x: int, y: int, img_type: str) -> None:
-        imgs_list: Optional[list[dict[str, int]]] = None
-        if img_type == settings.IMG_TYPE_TILES:
-            imgs_list = self.tiles_data
-        elif img_type == settings.IMG_TYPE_SPRITES:
-            imgs_list = self.sprites_data
-        elif img_type == settings.IMG_TYPE_ITEMS:
-            imgs_list = self.items_data
+        imgs_list = self._get_all_tiles_info().get(img_type)
         if imgs_list is None:
             return
-        for index, img in enumerate(imgs_list):
-            if img['x'] == x and img['y'] == y:
-                del imgs_list[index]
-                return
+        positions = self._index[img_type]
+        index = positions.pop((x, y), None)
+        if index is None:
+            return
+        # move the last image into the gap instead of shifting the list
+        last_img = imgs_list.pop()
+        if index < len(imgs_list):
+            imgs_list[index] = last_img
+            positions[(last_img['x'], last_img['y'])] = index
 
     def _get_tile_info_by_xy(self, x: int, y: int) -> tuple[str, dict[str, int]]:
         all_tiles_info = self._get_all_tiles_info()
-        for tile_type, tiles in all_tiles_info.items():
-            for tile_info in tiles:
-                if tile_info['x'] == x and tile_info['y'] == y:
-                    return (tile_type, tile_info)
+        for tile_type, positions in self._index.items():
+            index = positions.get((x, y))
+            if index is not None:
+                return (tile_type, all_tiles_info[tile_type][index])
         return ('', {})
 
     def _get_all_tiles_info(self) -> dict[str, list[dict[str, int]]]:
@@ -75,13 +106,17 @@ class GameDataStruct:
         }
 
     def add_tile_by_type(self, img_info: dict[str, int], img_type: str) -> None:
-        self._delete_tile_by_pos_with_type(img_info['x'], img_info['y'], img_type)
-        if img_type == settings.IMG_TYPE_TILES:
-            self.tiles_data.append(img_info)
-        elif img_type == settings.IMG_TYPE_SPRITES:
-            self.sprites_data.append(img_info)
-        elif img_type == settings.IMG_TYPE_ITEMS:
-            self.items_data.append(img_info)
+        imgs_list = self._get_all_tiles_info().get(img_type)
+        if imgs_list is None:
+            return
+        positions = self._index[img_type]
+        pos = (img_info['x'], img_info['y'])
+        index = positions.get(pos)
+        if index is None:
+            positions[pos] = len(imgs_list)
+            imgs_list.append(img_info)
+        else:
+            imgs_list[index] = img_info
 
     def set_unset_tile_collition(self, tile_type: str, tile: int) -> None:
         if self.collition_data.get(tile_type) is None:
@@ -91,6 +126,12 @@ class GameDataStruct:
             return
         self.collition_data[tile_type].append (tile)
 
+    def is_collition_tile(self, img: int) -> bool:
+        collition_tiles = self.collition_data.get(settings.IMG_TYPE_TILES)
+        if collition_tiles is None:
+            return img not in settings.NO_COLLITION_SPRITE
+        return img in collition_tiles
+
     @classmethod
     def load_world_data(cls, world_data_path: str) -> 'GameDataStruct':
         world_data_obj: GameDataStruct
@@ -24,3 +24,7 @@ class GameManager(ABC):
     @abstractmethod
     def clear(self, screen: pg.surface.Surface) -> None:
         ...
+
+    def overlay_info(self) -> str:
+        '''extra debug text shown under the fps counter'''
+        return ''
@@ -0,0 +1,80 @@
+import struct
+from dataclasses import fields
+
+from .common_type import ControlAction
+from .input_script import InputSource
+
+# magic, format version, level, rng seed, update rate, frame count
+_HEADER = struct.Struct('<4sHHQHI')
+_MAGIC = b'SSIR'
+_VERSION = 1
+_ACTIONS = [f.name for f in fields(ControlAction)]
+
+
+def _pack_action(control_action: ControlAction) -> int:
+    bits = 0
+    for index, action in enumerate(_ACTIONS):
+        if getattr(control_action, action):
+            bits |= 1 << index
+    return bits
+
+def _unpack_action(bits: int, control_action: ControlAction) -> None:
+    for index, action in enumerate(_ACTIONS):
+        setattr(control_action, action, bool(bits & (1 << index)))
+
+
+class InputRecorder:
+    '''ControlAction state of every update step, one byte per step'''
+    def __init__(self) -> None:
+        self.level = 0
+        self.seed = 0
+        self.update_rate = 0
+        self._frames = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def start(self, level: int, seed: int, update_rate: int) -> None:
+        self.level = level
+        self.seed = seed
+        self.update_rate = update_rate
+        self._frames.clear()
+
+    def record(self, control_action: ControlAction) -> None:
+        self._frames.append(_pack_action(control_action))
+
+    def write(self, record_path: str) -> None:
+        with open(record_path, 'wb') as file_obj:
+            file_obj.write(_HEADER.pack(_MAGIC, _VERSION, self.level, self.seed,
+                                        self.update_rate, len(self._frames)))
+            file_obj.write(self._frames)
+
+
+class InputReplay(InputSource):
+    '''plays back a file written by InputRecorder'''
+    def __init__(self, level: int, seed: int, update_rate: int, frames: bytes) -> None:
+        self.level = level
+        self.seed = seed
+        self.update_rate = update_rate
+        self._frames = frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @classmethod
+    def load(cls, record_path: str) -> 'InputReplay':
+        with open(record_path, 'rb') as file_obj:
+            header = file_obj.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f'{record_path} is not an input record')
+            magic, version, level, seed, update_rate, frame_number = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f'{record_path} is not an input record of version {_VERSION}')
+            frames = file_obj.read(frame_number)
+        if len(frames) != frame_number:
+            raise ValueError(f'{record_path} is truncated')
+        return cls(level, seed, update_rate, frames)
+
+    def apply(self, frame: int, control_action: ControlAction) -> None:
+        bits = self._frames[frame] if frame < len(self._frames) else 0
+        _unpack_action(bits, control_action)
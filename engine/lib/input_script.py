@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+from .common_type import ControlAction
+
+
+class InputSource(ABC):
+    '''drives the player ControlAction when there is no keyboard'''
+    @abstractmethod
+    def apply(self, frame: int, control_action: ControlAction) -> None:
+        ...
+
+
+class InputScript(InputSource):
+    '''ControlAction changes keyed by frame, loaded from a text file
+
+    one change per line: <frame> <ACTION> <0|1>, lines starting with # are skipped
+    '''
+    def __init__(self, changes: dict[int, list[tuple[str, bool]]]) -> None:
+        self._changes = changes
+
+    @classmethod
+    def load(cls, script_path: str) -> 'InputScript':
+        changes: dict[int, list[tuple[str, bool]]] = {}
+        with open(script_path, 'r') as file_obj:
+            for line_number, line in enumerate(file_obj, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                frame, action, value = line.split()
+                if action not in ControlAction.__dataclass_fields__:
+                    raise ValueError(f'{script_path}:{line_number} unknown action {action}')
+                changes.setdefault(int(frame), []).append((action, value == '1'))
+        return cls(changes)
+
+    def apply(self, frame: int, control_action: ControlAction) -> None:
+        for action, value in self._changes.get(frame, []):
+            setattr(control_action, action, value)
+
+
+class DemoInput(InputSource):
+    '''run right with some backtracking, jump, shoot and throw grenades'''
+    def apply(self, frame: int, control_action: ControlAction) -> None:
+        control_action.RUN_RIGHT = (frame // 120) % 4 != 3
+        control_action.RUN_LEFT = (frame // 120) % 4 == 3
+        if frame % 50 == 0:
+            control_action.JUMPING = True
+        control_action.SHOOT = frame % 30 < 20
+        if frame % 200 == 0:
+            control_action.THROW_GRENADE = True
@@ -57,6 +57,8 @@ class KeyMap:
         return self._key_press() and self._key_event.key == pygame.K_l
     def key_F1_press(self) -> bool:
         return self._key_press() and self._key_event.key == pygame.K_F1
+    def key_F3_press(self) -> bool:
+        return self._key_press() and self._key_event.key == pygame.K_F3
     def key_c_press(self) -> bool:
         return self._key_press() and self._key_event.key == pygame.K_c
     # other function key end
@@ -0,0 +1,199 @@
+import glob
+import mmap
+import os
+import struct
+from typing import Any, Optional
+
+from .. import settings
+from .game_data import GameDataStruct
+
+try:
+    import numpy as np
+except ImportError:  # optional, records are unpacked with struct without it
+    np = None
+
+# magic, format version, tiles, items, sprites, layers with a collition list,
+# collition images of tiles, items and sprites, level info entries
+_HEADER = struct.Struct('<4sHIIIBHHHH')
+_MAGIC = b'SSLV'
+_VERSION = 1
+# x, y, img, flags of one tile
+_RECORD = struct.Struct('<iiHH')
+_COLLITION_IMG = struct.Struct('<H')
+# level info name, value
+_INFO = struct.Struct('<16si')
+RECORD_DTYPE: Any = None
+if np is not None:
+    RECORD_DTYPE = np.dtype([('x', '<i4'), ('y', '<i4'), ('img', '<u2'), ('flags', '<u2')])
+FLAG_SOLID = 1
+LEVEL_EXT = '.lvl'
+LAYERS = (settings.IMG_TYPE_TILES, settings.IMG_TYPE_ITEMS, settings.IMG_TYPE_SPRITES)
+
+Row = tuple[int, int, int, int]
+
+
+class LevelData:
+    '''a level as fixed width tile records per layer, solid tiles flagged'''
+    def __init__(self,
+                 layers: dict[str, Any],
+                 collition_data: dict[str, list[int]],
+                 level_info: dict[str, int]) -> None:
+        # a layer is a numpy record array when loaded with numpy,
+        # a list of (x, y, img, flags) otherwise
+        self._layers = layers
+        self.collition_data = collition_data
+        self.level_info = level_info
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._layers.values())
+
+    def row_count(self, img_type: str) -> int:
+        return len(self._layers[img_type])
+
+    def rows(self, img_type: str, start: int = 0, stop: Optional[int] = None) -> list[Row]:
+        records = self._layers[img_type]
+        if isinstance(records, list):
+            return records if start == 0 and stop is None else records[start:stop]
+        return records[start:stop].tolist()
+
+    def solid_cells(self, start: int = 0, stop: Optional[int] = None) -> list[tuple[int, int]]:
+        '''solid cells among the tile rows from start to stop'''
+        records = self._layers[settings.IMG_TYPE_TILES][start:stop]
+        if isinstance(records, list):
+            return [(x, y) for x, y, _, flags in records if flags & FLAG_SOLID]
+        solid = records[records['flags'] & FLAG_SOLID != 0]
+        return list(zip(solid['x'].tolist(), solid['y'].tolist()))
+
+    def columns(self) -> int:
+        '''columns up to the last tile'''
+        records = self._layers[settings.IMG_TYPE_TILES]
+        if len(records) == 0:
+            return 0
+        if isinstance(records, list):
+            return max(x for x, _, _, _ in records) + 1
+        return int(records['x'].max()) + 1
+
+    @classmethod
+    def from_world_data(cls, world_data: GameDataStruct) -> 'LevelData':
+        layers: dict[str, Any] = {}
+        for img_type, datas_info in zip(LAYERS, (world_data.tiles_data,
+                                                 world_data.items_data,
+                                                 world_data.sprites_data)):
+            if img_type == settings.IMG_TYPE_TILES:
+                layers[img_type] = [
+                    (d['x'], d['y'], d['img'],
+                     FLAG_SOLID if world_data.is_collition_tile(d['img']) else 0)
+                    for d in datas_info]
+            else:
+                layers[img_type] = [(d['x'], d['y'], d['img'], 0) for d in datas_info]
+        return cls(layers,
+                   {k: list(v) for k, v in world_data.collition_data.items()},
+                   dict(world_data.level_info))
+
+    def to_world_data(self) -> GameDataStruct:
+        '''per tile dicts for the editor'''
+        layers = [[{'x': x, 'y': y, 'img': img} for x, y, img, _ in self.rows(img_type)]
+                  for img_type in LAYERS]
+        return GameDataStruct(layers[0], layers[1], layers[2],
+                              {k: list(v) for k, v in self.collition_data.items()},
+                              dict(self.level_info))
+
+    def write(self, level_path: str) -> None:
+        collition_mask = 0
+        collition_lists: list[list[int]] = []
+        for index, img_type in enumerate(LAYERS):
+            imgs = self.collition_data.get(img_type)
+            if imgs is not None:
+                collition_mask |= 1 << index
+            collition_lists.append(imgs or [])
+        info = []
+        for name, value in self.level_info.items():
+            encoded = name.encode()
+            if len(encoded) > _INFO.size - 4:
+                raise ValueError(f'level info name {name!r} is longer than {_INFO.size - 4} bytes')
+            info.append(_INFO.pack(encoded, value))
+        layer_rows = [self.rows(img_type) for img_type in LAYERS]
+        with open(level_path, 'wb') as file_obj:
+            file_obj.write(_HEADER.pack(_MAGIC, _VERSION,
+                                        *(len(rows) for rows in layer_rows),
+                                        collition_mask,
+                                        *(len(imgs) for imgs in collition_lists),
+                                        len(info)))
+            for rows in layer_rows:
+                file_obj.write(b''.join(_RECORD.pack(*row) for row in rows))
+            for imgs in collition_lists:
+                file_obj.write(b''.join(_COLLITION_IMG.pack(img) for img in imgs))
+            file_obj.write(b''.join(info))
+
+    @classmethod
+    def load(cls, level_path: str) -> 'LevelData':
+        with open(level_path, 'rb') as file_obj:
+            if os.fstat(file_obj.fileno()).st_size < _HEADER.size:
+                raise ValueError(f'{level_path} is not a level file')
+            # records are copied out, so the file is not held open while playing
+            with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return cls._parse(buffer, level_path)
+
+    @classmethod
+    def _parse(cls, buffer: mmap.mmap, level_path: str) -> 'LevelData':
+        (magic, version, tiles, items, sprites, collition_mask,
+         *counts) = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{level_path} is not a level file of version {_VERSION}')
+        collition_counts, info_number = counts[:3], counts[3]
+        record_numbers = (tiles, items, sprites)
+        size = (_HEADER.size + sum(record_numbers) * _RECORD.size
+                + sum(collition_counts) * _COLLITION_IMG.size + info_number * _INFO.size)
+        if len(buffer) < size:
+            raise ValueError(f'{level_path} is truncated')
+        offset = _HEADER.size
+        layers: dict[str, Any] = {}
+        for img_type, number in zip(LAYERS, record_numbers):
+            if np is not None:
+                layers[img_type] = np.frombuffer(
+                    buffer, dtype=RECORD_DTYPE, count=number, offset=offset).copy()
+            else:
+                layers[img_type] = list(_RECORD.iter_unpack(
+                    buffer[offset:offset + number * _RECORD.size]))
+            offset += number * _RECORD.size
+        collition_data: dict[str, list[int]] = {}
+        for index, (img_type, number) in enumerate(zip(LAYERS, collition_counts)):
+            if collition_mask & (1 << index):
+                collition_data[img_type] = list(struct.unpack_from(f'<{number}H', buffer, offset))
+            offset += number * _COLLITION_IMG.size
+        level_info = {name.rstrip(b'\0').decode(): value for name, value in
+                      _INFO.iter_unpack(buffer[offset:offset + info_number * _INFO.size])}
+        return cls(layers, collition_data, level_info)
+
+
+def level_path(world_data_path: str, level: int) -> str:
+    return os.path.join(world_data_path, f'{level}{LEVEL_EXT}')
+
+def level_exists(world_data_path: str, level: int) -> bool:
+    return (os.path.exists(level_path(world_data_path, level))
+            or os.path.exists(os.path.join(world_data_path, f'{level}.pk')))
+
+def load_level(world_data_path: str, level: int) -> LevelData:
+    '''load a level file, falling back to the old pickled level'''
+    path = level_path(world_data_path, level)
+    if os.path.exists(path):
+        return LevelData.load(path)
+    return LevelData.from_world_data(GameDataStruct.load_world_data(
+        os.path.join(world_data_path, f'{level}.pk')))
+
+def convert_world_data(world_data_path: str, overwrite: bool = False) -> list[str]:
+    '''write a level file next to every pickled level, return the written paths'''
+    written: list[str] = []
+    for pk_path in sorted(glob.glob(os.path.join(world_data_path, '*.pk'))):
+        path = os.path.splitext(pk_path)[0] + LEVEL_EXT
+        if os.path.exists(path) and not overwrite:
+            continue
+        LevelData.from_world_data(GameDataStruct.load_world_data(pk_path)).write(path)
+        written.append(path)
+    return written
+
+def load_world_data(world_data_path: str, level: int) -> GameDataStruct:
+    '''the editor's per tile view of a level'''
+    if os.path.exists(level_path(world_data_path, level)):
+        return load_level(world_data_path, level).to_world_data()
+    return GameDataStruct.load_world_data(os.path.join(world_data_path, f'{level}.pk'))
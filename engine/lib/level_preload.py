@@ -0,0 +1,53 @@
+import time
+from collections.abc import Callable, Generator
+from typing import Generic, Optional, TypeVar
+
+from .common_func import run_steps
+
+T = TypeVar('T')
+
+
+class LevelPreloader(Generic[T]):
+    '''prepare the next level a little every step before it is needed
+
+    prepare returns work that pauses between small steps and returns the
+    level. step() runs the work on the calling thread until step_ms is
+    spent, so preparing never holds up a step for long. take() finishes a
+    level still being prepared and prepares one that was never requested
+    at once
+    '''
+    def __init__(self,
+                 prepare: Callable[[int], Generator[None, None, T]],
+                 step_ms: float) -> None:
+        self._prepare = prepare
+        self.step_ms = step_ms
+        self._level: Optional[int] = None
+        self._work: Optional[Generator[None, None, T]] = None
+        self._prepared: Optional[T] = None
+
+    def request(self, level: int) -> None:
+        if level != self._level:
+            self._level = level
+            self._work = self._prepare(level)
+            self._prepared = None
+
+    def step(self) -> None:
+        if self._work is None:
+            return
+        deadline = time.perf_counter() + self.step_ms / 1000
+        try:
+            while time.perf_counter() < deadline:
+                next(self._work)
+        except StopIteration as done:
+            self._prepared = done.value
+            self._work = None
+
+    def take(self, level: int) -> T:
+        requested, work, prepared = self._level, self._work, self._prepared
+        self._level, self._work, self._prepared = None, None, None
+        if level == requested:
+            if prepared is not None:
+                return prepared
+            if work is not None:
+                return run_steps(work)
+        return run_steps(self._prepare(level))
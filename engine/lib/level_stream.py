@@ -0,0 +1,130 @@
+from collections.abc import Iterator
+from typing import Any
+
+from pygame import Rect
+
+from .level_file import Row
+
+
+class LevelStream:
+    '''level rows split into column chunks, loaded ahead of the view and released behind it
+
+    a row goes into every chunk its image overlaps. chunks load within
+    margin of the view and are released one chunk farther out, so a chunk
+    on the edge is not rebuilt every step. objects parked on a released
+    chunk come back when it loads again
+
+    rows are handed out once sort_steps() has run. the rows of a layer are
+    kept in one list ordered by chunk instead of a list for every chunk, a
+    long level adds few objects for the garbage collector to walk
+    '''
+    def __init__(self, chunk_width: int, margin: int) -> None:
+        self._chunk_width = chunk_width
+        self._margin = margin
+        self._chunk_number = 0
+        # rows added and the first and last chunk of each, by layer
+        self._added: dict[str, list[Row]] = {}
+        self._added_chunks: dict[str, list[int]] = {}
+        # how many rows every chunk has, by layer
+        self._counts: dict[str, dict[int, int]] = {}
+        # rows ordered by chunk and where every chunk starts and stops, by layer
+        self._rows: dict[str, list[Row]] = {}
+        self._spans: dict[str, dict[int, tuple[int, int]]] = {}
+        # rows handed out by take_rows, given back by reset()
+        self._taken: set[tuple[int, str]] = set()
+        self._parked: dict[int, list[Any]] = {}
+        self.loaded: set[int] = set()
+        # chunks built and released since reset()
+        self.loads = 0
+        self.releases = 0
+
+    def reset(self) -> None:
+        '''back to before the first update, with every row in place again'''
+        self._taken.clear()
+        self._parked.clear()
+        self.loaded.clear()
+        self.loads = 0
+        self.releases = 0
+
+    def set_width(self, world_width: int) -> None:
+        self._chunk_number = -(-world_width // self._chunk_width)
+
+    def chunk_index(self, x: int) -> int:
+        return x // self._chunk_width
+
+    def add(self, img_type: str, row: Row, left: int, right: int) -> None:
+        '''add a row drawn from left to right in world pixels'''
+        first, last = self.chunk_index(left), self.chunk_index(right - 1)
+        self._added.setdefault(img_type, []).append(row)
+        self._added_chunks.setdefault(img_type, []).extend((first, last))
+        counts = self._counts.setdefault(img_type, {})
+        for index in range(first, last + 1):
+            counts[index] = counts.get(index, 0) + 1
+
+    def sort_steps(self, batch: int) -> Iterator[None]:
+        '''order the rows added by chunk, pausing after every batch rows
+
+        rows keep the order they were added in within a chunk. runs once
+        every row is added
+        '''
+        for img_type, added in self._added.items():
+            counts = self._counts[img_type]
+            spans: dict[int, tuple[int, int]] = {}
+            start = 0
+            for index in sorted(counts):
+                stop = start + counts[index]
+                spans[index] = (start, stop)
+                start = stop
+            placed: list[Any] = [None] * start
+            fill = {index: span[0] for index, span in spans.items()}
+            added_chunks = self._added_chunks[img_type]
+            for part in range(0, len(added), batch):
+                for number in range(part, min(part + batch, len(added))):
+                    row = added[number]
+                    for index in range(added_chunks[2*number], added_chunks[2*number + 1] + 1):
+                        placed[fill[index]] = row
+                        fill[index] += 1
+                yield
+            self._rows[img_type] = placed
+            self._spans[img_type] = spans
+        self._added.clear()
+        self._added_chunks.clear()
+        self._counts.clear()
+
+    def rows(self, index: int, img_type: str) -> list[Row]:
+        if (index, img_type) in self._taken:
+            return []
+        start, stop = self._spans.get(img_type, {}).get(index, (0, 0))
+        return self._rows.get(img_type, [])[start:stop]
+
+    def take_rows(self, index: int, img_type: str) -> list[Row]:
+        '''rows for things spawned once, they are not returned again'''
+        rows = self.rows(index, img_type)
+        self._taken.add((index, img_type))
+        return rows
+
+    def park(self, index: int, obj: Any) -> None:
+        self._parked.setdefault(index, []).append(obj)
+
+    def unpark(self, index: int) -> list[Any]:
+        return self._parked.pop(index, [])
+
+    def parked(self) -> list[Any]:
+        return [obj for index in sorted(self._parked) for obj in self._parked[index]]
+
+    def _chunk_range(self, view: Rect, margin: int) -> range:
+        first = max(self.chunk_index(view.left - margin), 0)
+        last = min(self.chunk_index(view.right + margin - 1), self._chunk_number - 1)
+        return range(first, last + 1)
+
+    def update(self, view: Rect) -> tuple[list[int], list[int]]:
+        '''chunks to build and chunks to release for the view, in order'''
+        keep = self._chunk_range(view, self._margin + self._chunk_width)
+        release = sorted(index for index in self.loaded if index not in keep)
+        load = [index for index in self._chunk_range(view, self._margin)
+                if index not in self.loaded]
+        self.loaded.difference_update(release)
+        self.loaded.update(load)
+        self.loads += len(load)
+        self.releases += len(release)
+        return load, release
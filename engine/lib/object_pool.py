@@ -0,0 +1,42 @@
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    '''keeps released objects for reuse, at most max_size of them'''
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._free: list[T] = []
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Optional[T]:
+        '''a released object to re-initialise, None when the caller must create one'''
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+        self.created += 1
+        return None
+
+    def release(self, obj: T) -> None:
+        if len(self._free) >= self.max_size:
+            self.dropped += 1
+            return
+        self._free.append(obj)
+
+    def clear(self) -> None:
+        self._free.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'free': len(self._free),
+            'max_size': self.max_size,
+            'created': self.created,
+            'reused': self.reused,
+            'dropped': self.dropped
+        }
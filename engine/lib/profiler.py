@@ -0,0 +1,80 @@
+import csv
+import time
+from collections import deque
+from typing import IO, Any, Optional
+
+
+class FrameProfiler:
+    '''time named sections of a frame, each mark closes the section since the previous mark
+
+    every call returns straight away while disabled
+    '''
+    def __init__(self, history: int = 120) -> None:
+        self.enabled = False
+        self.frame_number = 0
+        self.frame_times: deque[float] = deque(maxlen=history)
+        self.worst_frame = 0.0
+        self._history: deque[dict[str, float]] = deque(maxlen=history)
+        self._sections: dict[str, float] = {}
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._csv_file: Optional[IO[str]] = None
+        self._csv_writer: Optional[Any] = None
+
+    def start_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._frame_start = self._last_mark = time.perf_counter()
+        self._sections = {}
+
+    def mark(self, section: str) -> None:
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._sections[section] = self._sections.get(section, 0.0) + (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        frame_time = (time.perf_counter() - self._frame_start) * 1000
+        self.frame_number += 1
+        self.frame_times.append(frame_time)
+        self.worst_frame = max(self.worst_frame, frame_time)
+        self._history.append(self._sections)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow((self.frame_number, 'total', f'{frame_time:.4f}'))
+            for section, section_time in self._sections.items():
+                self._csv_writer.writerow((self.frame_number, section, f'{section_time:.4f}'))
+
+    def averages(self) -> dict[str, float]:
+        '''rolling average ms of every section over the kept frames'''
+        totals: dict[str, float] = {}
+        for sections in self._history:
+            for section, section_time in sections.items():
+                totals[section] = totals.get(section, 0.0) + section_time
+        frames = max(len(self._history), 1)
+        return {section: total / frames for section, total in totals.items()}
+
+    def reset(self) -> None:
+        '''drop kept timings, a frame already running is timed from now'''
+        self.frame_times.clear()
+        self._history.clear()
+        self.worst_frame = 0.0
+        self._frame_start = self._last_mark = time.perf_counter()
+
+    def open_csv(self, csv_path: str) -> None:
+        self.close_csv()
+        self._csv_file = open(csv_path, 'w', newline='')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(('frame', 'section', 'ms'))
+
+    def close_csv(self) -> None:
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+
+    @property
+    def logging(self) -> bool:
+        return self._csv_file is not None
@@ -0,0 +1,51 @@
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from pygame import Rect
+
+T = TypeVar('T', bound=Hashable)
+
+
+class SpatialHash(Generic[T]):
+    '''grid buckets of moving objects, rebuilt every step
+
+    objects that never move go in with insert_static() and stay until clear()
+    '''
+    def __init__(self, cell_size: int) -> None:
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[T]] = {}
+        # buckets of insert_static()
+        self._static: dict[tuple[int, int], tuple[T, ...]] = {}
+
+    def _cells_in(self, area: Rect) -> list[tuple[int, int]]:
+        size = self._cell_size
+        return [(cell_x, cell_y)
+                for cell_x in range(area.left // size, (area.right - 1) // size + 1)
+                for cell_y in range(area.top // size, (area.bottom - 1) // size + 1)]
+
+    def insert(self, obj: T, area: Rect) -> None:
+        for cell in self._cells_in(area):
+            self._cells.setdefault(cell, []).append(obj)
+
+    def insert_static(self, obj: T, area: Rect) -> None:
+        '''buckets of static objects are tuples, tuples of untracked objects
+        drop out of garbage collection so a large hash kept for a whole level
+        does not add to every full collection
+        '''
+        static = self._static
+        for cell in self._cells_in(area):
+            static[cell] = static.get(cell, ()) + (obj,)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._static.clear()
+
+    def query(self, area: Rect) -> list[T]:
+        '''objects in the cells overlapping the area, each once'''
+        found: dict[T, None] = {}
+        for cell in self._cells_in(area):
+            for obj in self._static.get(cell, ()):
+                found[obj] = None
+            for obj in self._cells.get(cell, ()):
+                found[obj] = None
+        return list(found)
@@ -0,0 +1,51 @@
+from collections.abc import Iterable
+
+from pygame import Rect, SRCALPHA, sprite, surface
+
+from .asset_cache import convert_to_display
+from .camera import Camera
+
+
+class TileChunks:
+    '''static level sprites pre-rendered into fixed width chunk surfaces'''
+    def __init__(self, chunk_width: int, chunk_height: int) -> None:
+        self._chunk_width = chunk_width
+        self._chunk_height = chunk_height
+        self._chunks: dict[int, surface.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._chunks
+
+    def bake_chunk(self, index: int, sprites: Iterable[sprite.Sprite]) -> None:
+        '''build one chunk from the sprites overlapping it, in the given order'''
+        chunk = surface.Surface((self._chunk_width, self._chunk_height), SRCALPHA)
+        offset = index * self._chunk_width
+        for s in sprites:
+            if s.image is not None and s.rect is not None:
+                chunk.blit(s.image, (s.rect.x - offset, s.rect.y))
+        self._chunks[index] = convert_to_display(chunk)
+
+    def release(self, index: int) -> None:
+        self._chunks.pop(index, None)
+
+    def snapshot(self) -> dict[int, surface.Surface]:
+        '''the baked chunks, shared, do not draw on them'''
+        return dict(self._chunks)
+
+    def restore(self, chunks: dict[int, surface.Surface]) -> None:
+        self._chunks = dict(chunks)
+
+    def draw(self, screen: surface.Surface, camera: Camera) -> None:
+        view = camera.render_rect()
+        first = view.left // self._chunk_width
+        last = (view.right - 1) // self._chunk_width
+        for index in range(first, last + 1):
+            chunk = self._chunks.get(index)
+            if chunk is None:
+                continue
+            chunk_rect = Rect(index*self._chunk_width, 0,
+                              self._chunk_width, self._chunk_height)
+            screen.blit(chunk, camera.apply(chunk_rect))
@@ -0,0 +1,194 @@
+import math
+from collections.abc import Generator, Iterable, Iterator
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from pygame import Rect, Vector2
+
+from .common_func import run_steps
+from .spatial_hash import SpatialHash
+
+# merged colliders are bucketed in squares this many tiles wide
+COLLIDER_CELL_TILES = 4
+# cells between pauses when the work is not spread over steps
+_RUN_BATCH = 4096
+
+
+class RayHit(NamedTuple):
+    cell: tuple[int, int]
+    # where the ray enters the cell and how far along the ray that is
+    point: Vector2
+    distance: float
+
+
+def merge_cells_steps(cells: Iterable[tuple[int, int]],
+                      tile_size: tuple[int, int],
+                      batch: int) -> Generator[None, None, list[Rect]]:
+    '''merge_cells pausing after about every batch cells'''
+    tile_width, tile_height = tile_size
+    # columns of every row in blocks of batch columns, sorted a block at a time
+    rows: dict[int, dict[int, list[int]]] = {}
+    cell_iter = iter(cells)
+    while part := list(islice(cell_iter, batch)):
+        for cell_x, cell_y in part:
+            rows.setdefault(cell_y, {}).setdefault(cell_x // batch, []).append(cell_x)
+        yield
+    rects: list[Rect] = []
+    # (first column, last column) -> rect still growing down
+    open_runs: dict[tuple[int, int], Rect] = {}
+    for cell_y in sorted(rows):
+        blocks = rows[cell_y]
+        runs: list[tuple[int, int]] = []
+        for block in sorted(blocks):
+            for cell_x in sorted(blocks[block]):
+                if runs and runs[-1][1] == cell_x - 1:
+                    runs[-1] = (runs[-1][0], cell_x)
+                else:
+                    runs.append((cell_x, cell_x))
+            yield
+        next_runs: dict[tuple[int, int], Rect] = {}
+        for start in range(0, len(runs), batch):
+            for run in runs[start:start + batch]:
+                rect = open_runs.pop(run, None)
+                if rect is not None and rect.bottom == cell_y * tile_height:
+                    rect.height += tile_height
+                else:
+                    rect = Rect(run[0] * tile_width, cell_y * tile_height,
+                                (run[1] - run[0] + 1) * tile_width, tile_height)
+                    rects.append(rect)
+                next_runs[run] = rect
+            yield
+        open_runs = next_runs
+    return rects
+
+def merge_cells(cells: Iterable[tuple[int, int]], tile_size: tuple[int, int]) -> list[Rect]:
+    '''cover the cells with few rects, runs along each row stacked with equal runs below'''
+    return run_steps(merge_cells_steps(cells, tile_size, _RUN_BATCH))
+
+
+class TileGrid:
+    '''solid tile cells of a level, walked cell by cell by rays'''
+    def __init__(self, tile_size: tuple[int, int]) -> None:
+        self._tile_width, self._tile_height = tile_size
+        self.cells: set[tuple[int, int]] = set()
+        # solid tiles merged into few rects for sweeping roles and grenades
+        self.collider_rects: list[Rect] = []
+        self._collider_hash: SpatialHash[int] = SpatialHash(self._tile_width * COLLIDER_CELL_TILES)
+
+    def set_solid(self, cells: Iterable[tuple[int, int]]) -> None:
+        run_steps(self.set_solid_steps(cells, _RUN_BATCH))
+
+    def set_solid_steps(self, cells: Iterable[tuple[int, int]], batch: int) -> Iterator[None]:
+        '''set_solid pausing after about every batch cells'''
+        solid: set[tuple[int, int]] = set()
+        cell_iter = iter(cells)
+        while part := list(islice(cell_iter, batch)):
+            solid.update(part)
+            yield
+        collider_rects = yield from merge_cells_steps(
+            solid, (self._tile_width, self._tile_height), batch)
+        self.cells = solid
+        self.collider_rects = collider_rects
+        self._collider_hash.clear()
+        # a merged rect can run the length of the level, it goes into
+        # the hash batch cells wide at a time
+        span = self._tile_width * COLLIDER_CELL_TILES * batch
+        for index, rect in enumerate(collider_rects):
+            for left in range(rect.left - rect.left % span, rect.right, span):
+                piece_left = max(left, rect.left)
+                piece_right = min(left + span, rect.right)
+                self._collider_hash.insert_static(
+                    index, Rect(piece_left, rect.top, piece_right - piece_left, rect.height))
+                yield
+
+    def colliders(self, area: Rect) -> list[Rect]:
+        '''merged solid rects near the area'''
+        return [self.collider_rects[index] for index in self._collider_hash.query(area)]
+
+    def is_solid(self, cell_x: int, cell_y: int) -> bool:
+        return (cell_x, cell_y) in self.cells
+
+    def raycast(self, start: Vector2, end: Vector2) -> Optional[RayHit]:
+        '''first solid cell the segment crosses, only visiting the cells it crosses'''
+        tile_width, tile_height = self._tile_width, self._tile_height
+        cell_x, cell_y = int(start.x // tile_width), int(start.y // tile_height)
+        end_cell = (int(end.x // tile_width), int(end.y // tile_height))
+        if self.is_solid(cell_x, cell_y):
+            return RayHit((cell_x, cell_y), Vector2(start), 0.0)
+        delta = end - start
+        length = delta.length()
+        step_x = 1 if delta.x > 0 else -1
+        step_y = 1 if delta.y > 0 else -1
+        # ray fraction at the next column and row border, and between borders
+        if delta.x != 0:
+            border_x = (cell_x + (1 if step_x > 0 else 0)) * tile_width
+            next_x = (border_x - start.x) / delta.x
+            gap_x = tile_width / abs(delta.x)
+        else:
+            next_x = gap_x = math.inf
+        if delta.y != 0:
+            border_y = (cell_y + (1 if step_y > 0 else 0)) * tile_height
+            next_y = (border_y - start.y) / delta.y
+            gap_y = tile_height / abs(delta.y)
+        else:
+            next_y = gap_y = math.inf
+        while (cell_x, cell_y) != end_cell:
+            if next_x < next_y:
+                cell_x += step_x
+                fraction = next_x
+                next_x += gap_x
+            else:
+                cell_y += step_y
+                fraction = next_y
+                next_y += gap_y
+            if fraction > 1:
+                break
+            if self.is_solid(cell_x, cell_y):
+                return RayHit((cell_x, cell_y), start + delta * fraction, length * fraction)
+        return None
+
+    def line_of_sight(self, start: Vector2, end: Vector2) -> bool:
+        return self.raycast(start, end) is None
+
+    def _cast_rect_x(self, area: Rect, move_x: int) -> Optional[RayHit]:
+        '''cast_rect for a horizontal move, walking the swept columns in order'''
+        tile_width, tile_height = self._tile_width, self._tile_height
+        rows = range(area.top // tile_height, (area.bottom - 1) // tile_height + 1)
+        if move_x > 0:
+            lead_x = area.right - 1
+            cols = range(area.left // tile_width, (lead_x + move_x) // tile_width + 1)
+        else:
+            lead_x = area.left
+            cols = range((area.right - 1) // tile_width, (lead_x + move_x) // tile_width - 1, -1)
+        for col in cols:
+            for row in rows:
+                if (col, row) not in self.cells:
+                    continue
+                # columns the area already overlaps are hit straight away
+                if move_x > 0:
+                    border_x = col * tile_width
+                    distance = max(0, border_x - lead_x)
+                else:
+                    border_x = (col + 1) * tile_width
+                    distance = max(0, lead_x - border_x)
+                return RayHit((col, row), Vector2(border_x, area.top), float(distance))
+        return None
+
+    def cast_rect(self, area: Rect, vect: Vector2) -> Optional[RayHit]:
+        '''nearest solid cell swept by area moving by vect
+
+        rays start from pixels along the area at most a tile apart, so every
+        cell the area passes over is visited
+        '''
+        if vect.y == 0:
+            return self._cast_rect_x(area, int(vect.x))
+        xs = list(range(area.left, area.right - 1, self._tile_width)) + [area.right - 1]
+        ys = list(range(area.top, area.bottom - 1, self._tile_height)) + [area.bottom - 1]
+        nearest: Optional[RayHit] = None
+        for x in xs:
+            for y in ys:
+                start = Vector2(x, y)
+                hit = self.raycast(start, start + vect)
+                if hit is not None and (nearest is None or hit.distance < nearest.distance):
+                    nearest = hit
+        return nearest
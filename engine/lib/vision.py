@@ -0,0 +1,81 @@
+import math
+from collections.abc import Iterable
+from typing import Optional
+
+from pygame import Rect, Vector2, sprite
+
+from .tile_grid import TileGrid
+
+
+class Vision:
+    '''sight checks for many viewers, cached for the tick and spread over ticks
+
+    each viewer is checked at most once a tick; when more viewers look than
+    checks_per_tick allows, each one is only checked every few ticks and keeps
+    its last result in between
+    '''
+    def __init__(self, checks_per_tick: int) -> None:
+        self.checks_per_tick = checks_per_tick
+        self._tick = 0
+        self._stride = 1
+        self._viewers = 0
+        self._targets: list[Rect] = []
+        self._tile_grid: Optional[TileGrid] = None
+        # check slot of every viewer and its last answer, kept until forget()
+        self._next_slot = 0
+        self._slots: dict[sprite.Sprite, int] = {}
+        self._results: dict[sprite.Sprite, tuple[int, bool]] = {}
+        # sight lines tested in the current tick
+        self.checks = 0
+
+    def clear(self) -> None:
+        self._tick = 0
+        self._stride = 1
+        self._viewers = 0
+        self._next_slot = 0
+        self._slots.clear()
+        self._results.clear()
+        self._targets = []
+
+    def forget(self, viewer: sprite.Sprite) -> None:
+        '''drop a viewer that is gone or parked, it starts over if it looks again'''
+        self._slots.pop(viewer, None)
+        self._results.pop(viewer, None)
+
+    def begin_tick(self, targets: Iterable[Rect], tile_grid: Optional[TileGrid]) -> None:
+        self._tick += 1
+        self._stride = max(1, math.ceil(self._viewers / self.checks_per_tick))
+        self._viewers = 0
+        self._targets = list(targets)
+        self._tile_grid = tile_grid
+        self.checks = 0
+
+    def can_see(self, viewer: sprite.Sprite, eye: Vector2, view_area: Rect) -> bool:
+        '''whether a target inside view_area is in sight from eye'''
+        cached = self._results.get(viewer)
+        if cached is not None and cached[0] == self._tick:
+            return cached[1]
+        self._viewers += 1
+        slot = self._slots.get(viewer)
+        if slot is None:
+            slot = self._slots[viewer] = self._next_slot
+            self._next_slot += 1
+        if cached is not None and (slot + self._tick) % self._stride != 0:
+            seen = cached[1]
+        else:
+            seen = self._look(eye, view_area)
+            self.checks += 1
+        self._results[viewer] = (self._tick, seen)
+        return seen
+
+    def _look(self, eye: Vector2, view_area: Rect) -> bool:
+        for target in self._targets:
+            if not target.colliderect(view_area):
+                continue
+            if self._tile_grid is None:
+                return True
+            # the head can show over a wall that hides the body
+            for point in (target.center, (target.centerx, target.top + 1)):
+                if self._tile_grid.line_of_sight(eye, Vector2(point)):
+                    return True
+        return False
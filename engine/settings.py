@@ -5,11 +5,24 @@ PRO_PATH = os.path.dirname(os.path.abspath(__file__))
 # engine stuff
 FULL_SCRREN = True
 SHOW_FPS = True
+# rendered text surfaces kept for reuse
+TEXT_CACHE_SIZE = 128
 FPS = 60
+# game logic runs at a fixed rate, all frame counters below count update steps
+FIXED_TIMESTEP = True
+UPDATE_RATE = 60
+MAX_CATCH_UP_STEPS = 5
 SCREEN_ORG_WIDTH = 800
 SCREEN_ORG_HEIGHT = 450
 GLOBAL_SCALE = 1
 MAX_LEVEL = 5
+# prepare the next level a little every update step while this one is played
+PRELOAD_NEXT_LEVEL = True
+# ms of every update step spent on it, and level rows prepared between time checks
+PRELOAD_STEP_MS = 2
+PRELOAD_BATCH = 512
+# level_info key of the exit column, the last column of the level without it
+LEVEL_INFO_EXIT = 'exit'
 SCREEN_WIDTH = SCREEN_ORG_WIDTH * GLOBAL_SCALE
 SCREEN_HEIGHT = SCREEN_ORG_HEIGHT * GLOBAL_SCALE
 MOVE_SPEED = 3
@@ -17,16 +30,36 @@ MOVE_SPEED = 3
 GRAVITY = 0.75
 MAX_GRAVITY = 6
 JUMP_FORCE = -11
+# sprites further than this outside the screen stop updating
+ACTIVATION_MARGIN = 200
+# how often enemies think by distance from the screen: (max distance, every n steps)
+AI_THINK_INTERVALS = ((0, 1), (ACTIVATION_MARGIN // 2, 2), (ACTIVATION_MARGIN, 4))
 
 # game rules
 GRENADE_NUMBER = 3
 PLAYER_DAMEGE = 15
 ENEMY_DAMEGE = 10
 GRENADE_DAMEGE = 50
-BULLET_LIFE_TIME = FPS * 1
+BULLET_LIFE_TIME = UPDATE_RATE * 1
+# pixels per second
+BULLET_SPEED = 500
+# enemy sight lines tested per update step before checks are spread over steps
+VISION_CHECKS_PER_TICK = 16
+# grid size for pairing projectiles with roles
+COMBAT_CELL_SIZE = 64
+# move bullets as numpy arrays when numpy is installed
+ARRAY_BULLETS = True
+# dead projectiles and explosions kept for reuse
+BULLET_POOL_SIZE = 512
+GRENADE_POOL_SIZE = 32
+EXPLODE_POOL_SIZE = 32
 
 # game asset something
 TILE_SIZE = (32, 32)
+# tile columns baked into one static chunk surface
+TILE_CHUNK_COLUMNS = 16
+# chunks are built this far outside the screen, enemies in them spawn then
+STREAM_MARGIN = ACTIVATION_MARGIN
 GAME_START_IMG_PATH = os.path.join(PRO_PATH, 'content/image/game_start')
 GAME_PLAY_BACK_IMG_PATH = os.path.join(PRO_PATH, 'content/image/background')
 TILES_BTN_IMG_PATH = os.path.join(PRO_PATH, 'content/image/button/tileMenu.png')
@@ -1,7 +1,11 @@
-from . import cloud_sprite, tile_sprite, item_sprite, role_sprite
+from . import cloud_sprite, tile_sprite, item_sprite, role_sprite, combat
 
 CloudSprite = cloud_sprite.CloudSprite
 PlayerSprite = role_sprite.PlayerSprite
 EnemySprite = role_sprite.EnemySprite
 TileSprite = tile_sprite.TileSprite
 ItemSprite = item_sprite.ItemSprite
+RoleType = role_sprite.RoleType
+Bullet = role_sprite.Bullet
+Grenade = role_sprite.Grenade
+CombatResolver = combat.CombatResolver
@@ -0,0 +1,99 @@
+import math
+from collections.abc import Iterable
+from typing import Optional
+
+from pygame import sprite
+
+from .. import lib
+from .. import settings
+from .role_sprite import Bullet, ExplodeSprite, RoleSprite, RoleType
+
+
+def _bullet_damege(role_type: RoleType) -> int:
+    '''damege a bullet does to a role of role_type'''
+    if role_type == RoleType.enemy:
+        return settings.PLAYER_DAMEGE
+    return settings.ENEMY_DAMEGE
+
+
+class CombatResolver:
+    '''pair projectiles and explosions with the roles they overlap, then apply damege in one batch'''
+    def __init__(self, cell_size: int) -> None:
+        self._role_hash: lib.SpatialHash[RoleSprite] = lib.SpatialHash(cell_size)
+        # narrow phase tests and hits in the last resolve
+        self.checks = 0
+        self.hits = 0
+
+    def resolve(self,
+                roles: Iterable[sprite.Sprite],
+                bullets: Iterable[sprite.Sprite],
+                bullet_array: Optional[lib.BulletArray],
+                explodes: Iterable[sprite.Sprite]) -> None:
+        self.checks = 0
+        self.hits = 0
+        self._role_hash.clear()
+        targets = [role for role in roles
+                   if isinstance(role, RoleSprite) and role.rect is not None
+                   and not role.is_empty_health()]
+        for role in targets:
+            self._role_hash.insert(role, role.rect)
+        damege: dict[RoleSprite, int] = {}
+        hit_flash: set[RoleSprite] = set()
+        killed_bullets: list[Bullet] = []
+
+        def can_take(role: RoleSprite) -> bool:
+            return role.health_value - damege.get(role, 0) > 0
+
+        def add_damege(role: RoleSprite, value: int) -> None:
+            damege[role] = damege.get(role, 0) + value
+            self.hits += 1
+
+        for bullet in bullets:
+            if not isinstance(bullet, Bullet) or bullet.rect is None:
+                continue
+            for role in self._role_hash.query(bullet.travel_rect):
+                if role.role_type == bullet.bullet_type or not can_take(role):
+                    continue
+                self.checks += 1
+                if role.rect is None or not role.rect.colliderect(bullet.travel_rect):
+                    continue
+                add_damege(role, _bullet_damege(role.role_type))
+                if role.role_type == RoleType.enemy:
+                    hit_flash.add(role)
+                killed_bullets.append(bullet)
+                break
+
+        if bullet_array is not None and targets:
+            bullet_array.build_index()
+            for role in targets:
+                if role.rect is None or not can_take(role):
+                    continue
+                indices = bullet_array.overlapping(role.rect, role.role_type)
+                self.checks += len(indices)
+                if len(indices) == 0:
+                    continue
+                value = _bullet_damege(role.role_type)
+                remaining = role.health_value - damege.get(role, 0)
+                indices = indices[:math.ceil(remaining / value)]
+                bullet_array.kill(indices)
+                for _ in indices:
+                    add_damege(role, value)
+                if role.role_type == RoleType.enemy:
+                    hit_flash.add(role)
+
+        for exp in explodes:
+            if not isinstance(exp, ExplodeSprite) or exp.rect is None:
+                continue
+            for role in self._role_hash.query(exp.rect):
+                if role in exp.hit_sprites:
+                    continue
+                self.checks += 1
+                if role.rect is None or not role.rect.colliderect(exp.rect):
+                    continue
+                exp.hit_sprites.add(role)
+                add_damege(role, settings.GRENADE_DAMEGE)
+
+        for bullet in killed_bullets:
+            bullet.kill()
+        for role, value in damege.items():
+            role.take_damege(value, role in hit_flash)
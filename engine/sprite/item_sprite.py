@@ -14,13 +14,3 @@ class ItemSprite(sprite.Sprite):
         self.position = position
         self.rect = self.rect.move(position)
         self.metadata = metadata
-
-    def update(self, *_, **__) -> None:
-        if self.rect is None:
-            return
-        self.position.x += self.metadata.scroll_value_x
-        self.rect.x = int(self.position.x + self.metadata.shake_x)
-        self.rect.y = int(self.position.y + self.metadata.shake_y)
-        if self.rect.right < 0:
-            self.kill()
-
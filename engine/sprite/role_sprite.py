@@ -1,7 +1,7 @@
-import random
+import weakref
 from enum import Enum, auto
 
-from pygame import Vector2, image, sprite, rect, draw, surface, transform
+from pygame import Vector2, sprite, rect, draw, surface, transform
 import pygame
 
 from .. import lib
@@ -11,6 +11,26 @@ class RoleType(Enum):
     player = auto()
     enemy = auto()
 
+# frames sliced from a sheet, keyed by sheet then fram width
+_sheet_frams_cache: weakref.WeakKeyDictionary[
+    surface.Surface,
+    dict[int, tuple[list[surface.Surface], list[surface.Surface]]]
+] = weakref.WeakKeyDictionary()
+
+def _get_sheet_frams(image_sheet: surface.Surface,
+                     fram_with: int) -> tuple[list[surface.Surface], list[surface.Surface]]:
+    '''slice a sheet into frames and flipped frames once'''
+    sheet_frams = _sheet_frams_cache.setdefault(image_sheet, {})
+    if fram_with not in sheet_frams:
+        height = image_sheet.get_height()
+        # copy so frames do not keep the sheet alive
+        frams = [image_sheet.subsurface(rect.Rect(x, 0, fram_with, height)).copy()
+                 for x in range(0, image_sheet.get_width() - fram_with + 1, fram_with)]
+        flip_frams = [transform.flip(fram, True, False) for fram in frams]
+        sheet_frams[fram_with] = (frams, flip_frams)
+    return sheet_frams[fram_with]
+
+
 class AnimationSprite(sprite.Sprite):
     def __init__(self,
                  image_sheet: surface.Surface,
@@ -36,25 +56,18 @@ class AnimationSprite(sprite.Sprite):
         self._playing = False
         self._image_sheet = image_sheet
         self._fram_with = fram_with
-        self._fram_number = self._image_sheet.get_width() / fram_with
+        self._frams, self._flip_frams = _get_sheet_frams(image_sheet, fram_with)
+        self._fram_number = len(self._frams)
         self.rotate_value = 0.0
         self.flip = flip
         self.image = self._get_curren_fram()
         self.rect = self.image.get_rect().move(position)
 
-    def _get_curren_fram_area(self) -> rect.Rect:
-        return rect.Rect(
-            self._current_fram*self._fram_with,
-            0,
-            self._fram_with,
-            self._image_sheet.get_height()
-        )
-
     def _get_curren_fram(self) -> surface.Surface:
-        image = transform.rotate(
-            self._image_sheet.subsurface(self._get_curren_fram_area()),
-            self.rotate_value
-        )
+        if self.rotate_value == 0:
+            frams = self._flip_frams if self.flip else self._frams
+            return frams[self._current_fram]
+        image = transform.rotate(self._frams[self._current_fram], self.rotate_value)
         if self.flip:
             image = transform.flip(image, True, False)
         return image
@@ -80,45 +93,90 @@ class Bullet(sprite.Sprite):
                  position: Vector2,
                  vect: Vector2,
                  speed: int,
-                 tile_sprites: sprite.Group,
                  bullet_type: RoleType,
                  bullet_life_time: int) -> None:
         super().__init__()
+        self.init_bullet(metadata, image, position, vect, speed,
+                         bullet_type, bullet_life_time)
+
+    @classmethod
+    def create(cls,
+               metadata: lib.GameMetaData,
+               image: surface.Surface,
+               position: Vector2,
+               vect: Vector2,
+               speed: int,
+               bullet_type: RoleType,
+               bullet_life_time: int) -> 'Bullet':
+        '''reuse a killed bullet from the pool when there is one'''
+        bullet = bullet_pool.acquire()
+        if bullet is None:
+            return cls(metadata, image, position, vect, speed,
+                       bullet_type, bullet_life_time)
+        bullet.init_bullet(metadata, image, position, vect, speed,
+                           bullet_type, bullet_life_time)
+        return bullet
+
+    def init_bullet(self,
+                    metadata: lib.GameMetaData,
+                    image: surface.Surface,
+                    position: Vector2,
+                    vect: Vector2,
+                    speed: int,
+                    bullet_type: RoleType,
+                    bullet_life_time: int) -> None:
         self.metadata = metadata
         self.image = image
         self.position = position
         self.rect = image.get_rect().move(position)
+        # area swept in the last step, used for hits so fast bullets can not skip roles
+        self.travel_rect = self.rect.copy()
         self.speed = speed
         self.vect = vect
-        self.tile_sprites = tile_sprites
         self.bullet_type = bullet_type
         self.couter = 0
         self.life_time = bullet_life_time
+        # stopped by a tile, still hits roles on the way there and dies next step
+        self.spent = False
+
+    def kill(self) -> None:
+        was_alive = self.alive()
+        super().kill()
+        if was_alive:
+            bullet_pool.release(self)
 
     def _bullet_move(self, dt: float) -> None:
         if self.rect is None:
             return
-        self.rect.x += self.metadata.scroll_value_x
-        move_x = dt * self.speed * self.vect.x
-        self.rect.x += round(move_x)
+        start_x = self.rect.x
+        move_x = round(dt * self.speed * self.vect.x)
+        hit = self.metadata.tile_grid.cast_rect(self.rect, Vector2(move_x, 0))
+        self.rect.x += move_x
+        if hit is not None:
+            # stop against the tile, or stay put when already touching it
+            tile_left = hit.cell[0] * settings.TILE_SIZE[0]
+            if move_x > 0:
+                self.rect.x = max(start_x, min(self.rect.x, tile_left - self.rect.width))
+            else:
+                self.rect.x = min(start_x, max(self.rect.x, tile_left + settings.TILE_SIZE[0]))
+            self.spent = True
+        self.travel_rect = self.rect.union(self.rect.move(start_x - self.rect.x, 0))
 
     def _bullet_kill_detect(self) -> None:
         if self.rect is None:
             return
-        if self.rect.right < -50:
+        view = self.metadata.camera.view_rect()
+        if self.rect.right < view.left - 50:
             self.kill()
-        elif self.rect.left > settings.SCREEN_WIDTH + 50:
+        elif self.rect.left > view.right + 50:
             self.kill()
         elif self.couter > self.life_time:
             self.kill()
-        for sprite in self.tile_sprites:
-            if sprite.rect is None:
-                continue
-            if sprite.rect.colliderect(self.rect):
-                self.kill()
-                return
 
     def update(self, *_, **kwargs) -> None:
+        if self.spent:
+            self.kill()
+            return
         self.couter += 1
         dt: float = kwargs['dt']
         self._bullet_move(dt)
@@ -140,7 +198,30 @@ class ExplodeSprite(AnimationSprite):
             loop=loop,
             frequency=3
         )
-        self.hit_sprites: list[pygame.sprite.Sprite] = []
+        # roles already damaged by this explosion
+        self.hit_sprites: set[pygame.sprite.Sprite] = set()
+
+    @classmethod
+    def create(cls,
+               image_sheet: surface.Surface,
+               position: Vector2,
+               fram_with: int,
+               loop: bool = False) -> 'ExplodeSprite':
+        '''reuse a finished explosion from the pool when there is one'''
+        explode = explode_pool.acquire()
+        if explode is None:
+            return cls(image_sheet, position, fram_with, loop)
+        position.x -= fram_with//2
+        position.y -= fram_with//2
+        explode.init_animation(image_sheet, position, fram_with, loop=loop, frequency=3)
+        explode.hit_sprites = set()
+        return explode
+
+    def kill(self) -> None:
+        was_alive = self.alive()
+        super().kill()
+        if was_alive:
+            explode_pool.release(self)
 
     def update(self, *_, **__) -> None:
         playing = self.play()
@@ -155,13 +236,40 @@ class Grenade(sprite.Sprite):
                  explode_image: surface.Surface,
                  position: Vector2,
                  direction: int,
-                 tile_sprites: sprite.Group,
                  explode_sprites: sprite.Group,
                  grenade_type: RoleType) -> None:
         super().__init__()
+        self.init_grenade(metadata, image, explode_image, position, direction,
+                          explode_sprites, grenade_type)
+
+    @classmethod
+    def create(cls,
+               metadata: lib.GameMetaData,
+               image: surface.Surface,
+               explode_image: surface.Surface,
+               position: Vector2,
+               direction: int,
+               explode_sprites: sprite.Group,
+               grenade_type: RoleType) -> 'Grenade':
+        '''reuse an exploded grenade from the pool when there is one'''
+        grenade = grenade_pool.acquire()
+        if grenade is None:
+            return cls(metadata, image, explode_image, position, direction,
+                       explode_sprites, grenade_type)
+        grenade.init_grenade(metadata, image, explode_image, position, direction,
+                             explode_sprites, grenade_type)
+        return grenade
+
+    def init_grenade(self,
+                     metadata: lib.GameMetaData,
+                     image: surface.Surface,
+                     explode_image: surface.Surface,
+                     position: Vector2,
+                     direction: int,
+                     explode_sprites: sprite.Group,
+                     grenade_type: RoleType) -> None:
         self.grenade_id = 0
         self.grenade_type = grenade_type
-        self.tile_sprites = tile_sprites
         self.throw_speed = 7
         self.vect_y = -11.0
         self.metadata = metadata
@@ -169,48 +277,54 @@ class Grenade(sprite.Sprite):
         self.counter = 0
         self.explode_image = explode_image
         self.explode_sprites = explode_sprites
-        self.explode_time = settings.FPS * 2
+        self.explode_time = settings.UPDATE_RATE * 2
         self.rect = image.get_rect().move(position)
         self.direction = direction
 
+    def kill(self) -> None:
+        was_alive = self.alive()
+        super().kill()
+        if was_alive:
+            grenade_pool.release(self)
+
     def _collition_detect(self) -> Vector2:
         vect = Vector2(self.throw_speed * self.direction, self.vect_y)
         self.vect_y += settings.GRAVITY
         if self.vect_y >= settings.MAX_GRAVITY:
             self.vect_y = settings.MAX_GRAVITY
-        for tile in self.tile_sprites:
-            if self.rect is None or tile.rect is None:
-                continue
-            is_collide_x = tile.rect.colliderect(
+        if self.rect is None:
+            return vect
+        near_area = self.rect.union(self.rect.move(vect))
+        for tile_rect in self.metadata.tile_grid.colliders(near_area):
+            is_collide_x = tile_rect.colliderect(
                 rect.Rect(self.rect.x + vect.x, self.rect.y,
                           self.rect.width, self.rect.height)
             )
             if is_collide_x:
                 vect.x *= -1
                 self.direction *= -1
-            is_collide_y = tile.rect.colliderect(
+            is_collide_y = tile_rect.colliderect(
                 rect.Rect(self.rect.x, self.rect.y + vect.y,
                           self.rect.width, self.rect.height)
             )
             if is_collide_y:
                 if vect.y < 0:
-                    vect.y = tile.rect.bottom - self.rect.top
+                    vect.y = tile_rect.bottom - self.rect.top
                 else:
                     vect.x = 0
-                    vect.y = tile.rect.top - self.rect.bottom
+                    vect.y = tile_rect.top - self.rect.bottom
         return vect
 
     def _grenade_parabola(self) -> None:
         if self.rect is None:
             return
-        self.rect.x += self.metadata.scroll_value_x
         m_vect = self._collition_detect()
         self.rect = self.rect.move(m_vect)
 
     def _set_explode(self) -> None:
         if self.rect is None:
             return
-        explode_sprite = ExplodeSprite(
+        explode_sprite = ExplodeSprite.create(
             self.explode_image,
             Vector2(self.rect.centerx, self.rect.centery),
             80)
@@ -225,11 +339,18 @@ class Grenade(sprite.Sprite):
             self.kill()
 
 
+# killed projectiles and finished explosions, reset by create() on reuse
+bullet_pool: lib.ObjectPool[Bullet] = lib.ObjectPool(settings.BULLET_POOL_SIZE)
+grenade_pool: lib.ObjectPool[Grenade] = lib.ObjectPool(settings.GRENADE_POOL_SIZE)
+explode_pool: lib.ObjectPool[ExplodeSprite] = lib.ObjectPool(settings.EXPLODE_POOL_SIZE)
+
+
 class RoleSprite(AnimationSprite):
+    role_type: RoleType
+
     def __init__(self,
                  sprite_sheet_info: dict[str, dict[str, str]],
                  position: Vector2,
-                 tile_sprites: sprite.Group,
                  bullet_sprites: sprite.Group,
                  grenade_sprites: sprite.Group,
                  explode_sprites: sprite.Group,
@@ -237,16 +358,15 @@ class RoleSprite(AnimationSprite):
         self._sprite_sheet_info = sprite_sheet_info
         self.position = position
         self.metadata = metadata
-        self.tile_sprites = tile_sprites
         self.bullet_sprites = bullet_sprites
         self.grenade_sprites = grenade_sprites
         self.explode_sprites = explode_sprites
-        self.grenade_img = image.load(settings.GRENADE_IMG_PATH)
-        self.explode_img = image.load(settings.EXPLODE_IMG_PATH)
-        self.bullet_img = image.load(settings.BULLET_IMG_PATH)
+        self.grenade_img = lib.assets.load_image(settings.GRENADE_IMG_PATH)
+        self.explode_img = lib.assets.load_image(settings.EXPLODE_IMG_PATH)
+        self.bullet_img = lib.assets.load_image(settings.BULLET_IMG_PATH)
         self.action = 'idle'
         self._jump_vect_y = 0.0
-        self.attack_frequency = int(settings.FPS/3)
+        self.attack_frequency = int(settings.UPDATE_RATE/3)
         self.be_hiting_time = 0
         self._attack_counter = 0
         self.health_value = 100
@@ -255,34 +375,10 @@ class RoleSprite(AnimationSprite):
         self.animation_playing = True
         self._set_current_action(init=True)
 
-    def hit_detect(self, role: RoleType) -> None:
-        if self.rect is None:
-            return
-        # detect bullet damege
-        for sprite in self.bullet_sprites:
-            if self.health_value <= 0:
-                return
-            if sprite.rect is None:
-                continue
-            if sprite.rect.colliderect(self.rect):
-                bullet_type: RoleType = getattr(sprite, 'bullet_type')
-                if bullet_type == RoleType.player and role == RoleType.enemy:
-                    self.be_hiting_time = int(settings.FPS/10)
-                    self.health_value -= settings.PLAYER_DAMEGE
-                    sprite.kill()
-                elif bullet_type == RoleType.enemy and role == role.player:
-                    self.health_value -= settings.ENEMY_DAMEGE
-                    sprite.kill()
-        # detect explode damege
-        for exp in self.explode_sprites:
-            if exp.rect is None:
-                continue
-            hit_sprites: list[pygame.sprite.Sprite] = getattr(exp, 'hit_sprites')
-            if exp.rect.colliderect(self.rect):
-                if self in hit_sprites:
-                    continue
-                self.health_value -= settings.GRENADE_DAMEGE
-                hit_sprites.append(self)
+    def take_damege(self, damege: int, hit_flash: bool = False) -> None:
+        self.health_value -= damege
+        if hit_flash:
+            self.be_hiting_time = int(settings.UPDATE_RATE/10)
 
     def is_empty_health(self) -> bool:
         return self.health_value <= 0
@@ -301,7 +397,7 @@ class RoleSprite(AnimationSprite):
         action_info = self._sprite_sheet_info.get(self.action, None)
         if action_info is None:
             return
-        image_sheet = image.load(action_info['image_sheet'])
+        image_sheet = lib.assets.load_image(action_info['image_sheet'])
         fram_with = int(action_info['fram_with'])
         loop = True if action_info['loop'] == '1' else False
         if init:
@@ -347,32 +443,40 @@ class RoleSprite(AnimationSprite):
         pos_y = self.rect.bottom - int(self.rect.height / 2) - 5
         vect_x = -1 if self.flip else 1
         vect_y = 0
-        regular_bullet_speed = 500
+        regular_bullet_speed = settings.BULLET_SPEED
         speed_time = 0.0
         if role == RoleType.player:
             speed_time = 1.0
         else:
             speed_time = 0.5
-        bs = Bullet(
+        bullet_array = self.metadata.bullet_array
+        if bullet_array is not None:
+            bullet_array.spawn(
+                pos_x,
+                pos_y,
+                int(regular_bullet_speed*speed_time) * vect_x,
+                role,
+                int(settings.BULLET_LIFE_TIME * (1/speed_time))
+            )
+            return
+        bs = Bullet.create(
             self.metadata,
             self.bullet_img,
             Vector2(pos_x, pos_y),
             Vector2(vect_x, vect_y),
             int(regular_bullet_speed*speed_time),
-            self.tile_sprites,
             role,
             int(settings.BULLET_LIFE_TIME * (1/speed_time))
         )
         self.bullet_sprites.add(bs)
 
     def _throw_grenade(self, role: RoleType) -> None:
-        new_grenade = Grenade(
+        new_grenade = Grenade.create(
             self.metadata,
             self.grenade_img,
             self.explode_img,
             self.position,
             -1 if self.flip else 1,
-            self.tile_sprites,
             self.explode_sprites,
             role
         )
@@ -421,55 +525,52 @@ class RoleSprite(AnimationSprite):
 
     def _collition_detect(self, vect: Vector2) -> Vector2:
         new_vect = Vector2(vect.x, vect.y)
-        for sprite in self.tile_sprites:
-            collition: bool = getattr(sprite, 'collition')
-            if not collition:
-                continue
-            if self.rect is None or sprite.rect is None:
-                return new_vect
-            is_collide_x = sprite.rect.colliderect(
+        if self.rect is None:
+            return new_vect
+        near_area = self.rect.union(self.rect.move(vect))
+        for tile_rect in self.metadata.tile_grid.colliders(near_area):
+            is_collide_x = tile_rect.colliderect(
                 rect.Rect(self.rect.x + vect.x, self.rect.y,
                           self.rect.width, self.rect.height)
             )
             if is_collide_x:
                 new_vect.x = 0
-            is_collide_y = sprite.rect.colliderect(
+            is_collide_y = tile_rect.colliderect(
                 rect.Rect(self.rect.x, self.rect.y + vect.y,
                           self.rect.width, self.rect.height)
             )
             if is_collide_y:
                 if vect.y > 0:
-                    new_vect.y = sprite.rect.top - self.rect.bottom
+                    new_vect.y = tile_rect.top - self.rect.bottom
                 elif vect.y < 0:
-                    new_vect.y = sprite.rect.bottom - self.rect.top
+                    new_vect.y = tile_rect.bottom - self.rect.top
         return new_vect
 
 
 class PlayerSprite(RoleSprite):
+    role_type = RoleType.player
+
     def __init__(self,
                  sprite_sheet_info: dict[str, dict[str, str]],
                  position: Vector2,
-                 tile_sprites: sprite.Group,
                  bullet_sprites: sprite.Group,
                  grenade_sprites: sprite.Group,
                  explode_sprites: sprite.Group,
-                 background_lay_pos: list[pygame.Vector2],
-                 background_lay_width: int,
+                 world_width: int,
                  metadata: lib.GameMetaData) -> None:
-        super().__init__(sprite_sheet_info, position, tile_sprites,
+        super().__init__(sprite_sheet_info, position,
                          bullet_sprites, grenade_sprites, explode_sprites, metadata)
-        self.background_lay_pos = background_lay_pos
-        self.background_lay_width = background_lay_width
+        self.world_width = world_width
 
     def move(self) -> None:
         if self.rect is None:
             return
+        camera = self.metadata.camera
         border_left = False
         border_right = False
-        if self.rect.x <= 0:
+        if self.rect.x <= camera.view_rect().left:
             border_left = True
-        right_border = self.background_lay_pos[-1].x + self.background_lay_width
-        if self.rect.right >= right_border:
+        if self.rect.right >= self.world_width:
             border_right = True
         self.rect = self.rect.move(
             self._get_vec_with_action(
@@ -479,16 +580,8 @@ class PlayerSprite(RoleSprite):
             )
         )
         self.position.x, self.position.y = self.rect.x, self.rect.y
-        if right_border <= settings.SCREEN_WIDTH:
-            self.metadata.scroll_value_x = 0
-            return
         # scroll screen
-        if self.rect.x < settings.SCREEN_WIDTH//2:
-            self.metadata.scroll_value_x = 0
-            return
-        forward_distance = settings.SCREEN_WIDTH//2 - self.rect.x
-        self.rect.x = settings.SCREEN_WIDTH//2
-        self.metadata.scroll_value_x = forward_distance
+        camera.follow(self.rect, self.world_width)
 
     def hud_health_bar(self) -> None:
         x = 10
@@ -527,16 +620,15 @@ class PlayerSprite(RoleSprite):
         self.move()
         self._get_action(self.metadata.control_action)
         self.play()
-        self.hit_detect(RoleType.player)
-        self.hud()
         self._fall_off_screen_derect()
 
 
 class EnemySprite(RoleSprite):
+    role_type = RoleType.enemy
+
     def __init__(self,
                  sprite_sheet_info: dict[str, dict[str, str]],
                  position: Vector2,
-                 tile_sprites: sprite.Group,
                  bullet_sprites: sprite.Group,
                  player_sprite: sprite.Group,
                  grenade_sprites: sprite.Group,
@@ -545,37 +637,46 @@ class EnemySprite(RoleSprite):
         super().__init__(
             sprite_sheet_info,
             position,
-            tile_sprites,
             bullet_sprites,
             grenade_sprites,
             explode_sprites, metadata
         )
-        self._notice_symbol = image.load(settings.NOTICE_IMG_PATH)
+        self._notice_symbol = lib.assets.load_image(settings.NOTICE_IMG_PATH)
         self._player_sprite = player_sprite
         self._ai_action = lib.com_type.ControlAction()
-        self._ai_wake_time = settings.FPS * random.choice(range(0, 3)) / 2
+        self._ai_wake_time = settings.UPDATE_RATE * metadata.rng.choice(range(0, 3)) / 2
         self._vision_rect = rect.Rect(position.x - 30, position.y, 300, 40)
         self._ai_counter = 0
         self.health_value = 40
         self._wander_distance = settings.MOVE_SPEED * 35
         self._wander_vectx = 0
-        self._idling_time = settings.FPS * 3
+        self._idling_time = settings.UPDATE_RATE * 3
         self.lose_detect = 0
-        self.detect_time = settings.FPS // 2
-        self.attack_frequency = int(settings.FPS*2)
-        self._be_hiting = int(settings.FPS * 0.5)
-
-    def vision_col_detect(self) -> bool:
-        if self.lose_detect > 0:
-            self.lose_detect -= 1
-            return True
-        for sprite in self._player_sprite:
-            if sprite.rect is None:
-                continue
-            if sprite.alive() and sprite.rect.colliderect(self._vision_rect):
-                self.lose_detect = settings.FPS * 2
-                return True
-        return False
+        self.detect_time = settings.UPDATE_RATE // 2
+        self.attack_frequency = int(settings.UPDATE_RATE*2)
+        self._be_hiting = int(settings.UPDATE_RATE * 0.5)
+        self._detected = False
+
+    def kill(self) -> None:
+        super().kill()
+        self.metadata.vision.forget(self)
+        self.metadata.ai_scheduler.forget(self)
+
+    def _eye_position(self) -> Vector2:
+        if self.rect is None:
+            return Vector2()
+        return Vector2(self.rect.centerx, self.rect.top + self.rect.height // 3)
+
+    def _perceive(self, steps: int) -> None:
+        '''look for the player, remembering it for a while after losing sight'''
+        if self.metadata.vision.can_see(self, self._eye_position(), self._vision_rect):
+            self.lose_detect = settings.UPDATE_RATE * 2
+            self._detected = True
+        elif self.lose_detect > 0:
+            self.lose_detect -= steps
+            self._detected = True
+        else:
+            self._detected = False
 
     def be_hit_vision(self) -> None:
         self._be_hiting -= 1
@@ -584,14 +685,15 @@ class EnemySprite(RoleSprite):
         if self.action == 'idle':
             self.action = f'{self.action}_hit'
 
-    def _ai_wander(self) -> None:
-        if self.vision_col_detect():
+    def _ai_wander(self, last_counter: int) -> None:
+        if self._detected:
             self._ai_action = lib.com_type.ControlAction()
             self._ai_action.SHOOT = True
             return
         self._ai_action.SHOOT = False
         if not self._ai_action.RUN_LEFT or not self._ai_action.RUN_RIGHT:
-            if self._ai_counter % self._idling_time == 0:
+            # idle time ran out since the last think
+            if self._ai_counter // self._idling_time != last_counter // self._idling_time:
                 if self._wander_vectx == 0:
                     self._ai_action.RUN_LEFT = True
                 else:
@@ -604,18 +706,22 @@ class EnemySprite(RoleSprite):
                 self._ai_action.RUN_RIGHT = False
 
     def _ai(self) -> None:
-        if self.is_empty_health():
+        if self.is_empty_health() or self.rect is None:
             return
+        steps = self.metadata.ai_scheduler.think_steps(self, self.rect)
+        if steps == 0:
+            return
+        self._perceive(steps)
         if self._ai_wake_time > 0:
-            self._ai_wake_time -= 1
+            self._ai_wake_time -= steps
             return
-        self._ai_counter += 1
-        self._ai_wander()
+        last_counter = self._ai_counter
+        self._ai_counter += steps
+        self._ai_wander(last_counter)
 
     def move(self) -> None:
         if self.rect is None:
             return
-        self.rect.x += self.metadata.scroll_value_x
         move_rect = self._get_vec_with_action(self._ai_action)
         self._wander_vectx += int(move_rect.x)
         self.rect = self.rect.move(move_rect)
@@ -632,24 +738,26 @@ class EnemySprite(RoleSprite):
 
     def draw_debug_box(self) -> None:
         self.update_vision_rect()
-        draw.rect(self.metadata.scrren, settings.RGB_RED, self._vision_rect, 2)
+        draw.rect(self.metadata.scrren, settings.RGB_RED,
+                  self.metadata.camera.apply(self._vision_rect), 2)
 
-    def _draw_detected_symbol(self) -> None:
-        if not self.vision_col_detect() or self.rect is None:
+    def draw_detected_symbol(self) -> None:
+        if not self._detected or self.rect is None or self.is_empty_health():
             return
         f = 1 if not self.flip else -1
         self.metadata.scrren.blit(
             self._notice_symbol,
-            Vector2(
+            self.metadata.camera.apply_point(Vector2(
                 self.rect.x - (self._notice_symbol.get_width()/2*f),
                 self.rect.y - self._notice_symbol.get_height()
-            )
+            ))
         )
 
     def _out_world_kill(self) -> None:
         if self.rect is None:
             return
-        if self.rect.right < -50 or self.rect.top > settings.SCREEN_HEIGHT:
+        view = self.metadata.camera.view_rect()
+        if self.rect.right < view.left - 50 or self.rect.top > settings.SCREEN_HEIGHT:
             self.kill()
 
     def update(self, *_, **__) -> None:
@@ -657,7 +765,5 @@ class EnemySprite(RoleSprite):
         self._out_world_kill()
         self.move()
         self._get_action(self._ai_action, RoleType.enemy)
-        self.hit_detect(RoleType.enemy)
         self.animation_playing = self.play()
         self.death_disappear()
-        self._draw_detected_symbol()
@@ -1,6 +1,9 @@
-from . import menu, button, button_container, tip
+from . import menu, button, button_container, tip, text_cache, profiler_overlay
 
 Menu = menu.Menu
 Button = button.Button
 ButtonContainer = button_container.ButtonContainer
 Tip = tip.Tip
+ProfilerOverlay = profiler_overlay.ProfilerOverlay
+get_font = text_cache.get_font
+render_text = text_cache.render_text
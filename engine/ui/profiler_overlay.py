@@ -0,0 +1,68 @@
+from typing import Optional
+
+import pygame as pg
+
+from .. import settings
+from ..lib import FrameProfiler
+from .text_cache import get_font
+
+GRAPH_HEIGHT = 40
+# frame time at the top of the graph
+GRAPH_MAX_MS = 1000 / 30
+# text changes every frame, only re-render it twice a second
+REFRESH_MS = 500
+
+
+class ProfilerOverlay:
+    '''section averages, worst frame and a frame time graph of a FrameProfiler'''
+    def __init__(self, profiler: FrameProfiler, position: pg.Vector2, size: int = 16) -> None:
+        self._profiler = profiler
+        self.position = position
+        self._font = get_font(size)
+        self._line_height = self._font.get_linesize()
+        self._lines: list[pg.surface.Surface] = []
+        self._panel = pg.surface.Surface((0, 0), pg.SRCALPHA)
+        self._last_refresh: Optional[int] = None
+
+    def _render_lines(self) -> None:
+        frame_times = self._profiler.frame_times
+        avg_frame = sum(frame_times) / len(frame_times) if frame_times else 0.0
+        texts = [f'frame {avg_frame:.2f}ms  worst {self._profiler.worst_frame:.2f}ms']
+        for section, section_time in sorted(self._profiler.averages().items()):
+            texts.append(f'{section} {section_time:.2f}ms')
+        self._lines = [self._font.render(text, False, settings.RGB_WHITE) for text in texts]
+        width = max(max(line.get_width() for line in self._lines), self._profiler.frame_times.maxlen or 0)
+        height = len(self._lines) * self._line_height + GRAPH_HEIGHT + 2
+        self._panel = pg.surface.Surface((width + 8, height + 8), pg.SRCALPHA)
+        self._panel.fill(settings.RGBA_BLACK)
+
+    def _frame_budget_ms(self) -> float:
+        '''time of a drawn frame, one update step when drawing is not capped'''
+        return 1000 / (settings.FPS or settings.UPDATE_RATE)
+
+    def _draw_graph(self, screen: pg.surface.Surface, top: int) -> None:
+        left = int(self.position.x)
+        budget_ms = self._frame_budget_ms()
+        frame_times = self._profiler.frame_times
+        graph_rect = pg.Rect(left, top, frame_times.maxlen or 0, GRAPH_HEIGHT)
+        pg.draw.rect(screen, settings.RGB_BLACK, graph_rect)
+        for index, frame_time in enumerate(frame_times):
+            height = min(int(frame_time / GRAPH_MAX_MS * GRAPH_HEIGHT), GRAPH_HEIGHT)
+            color = settings.RGB_YELLOW if frame_time <= budget_ms else settings.RGB_RED
+            pg.draw.line(screen, color, (left + index, graph_rect.bottom - 1),
+                         (left + index, graph_rect.bottom - height))
+        budget_y = graph_rect.bottom - int(budget_ms / GRAPH_MAX_MS * GRAPH_HEIGHT)
+        pg.draw.line(screen, settings.RGB_GRAY, (graph_rect.left, budget_y),
+                     (graph_rect.right, budget_y))
+
+    def draw(self, screen: pg.surface.Surface) -> None:
+        now = pg.time.get_ticks()
+        if self._last_refresh is None or now - self._last_refresh >= REFRESH_MS:
+            self._render_lines()
+            self._last_refresh = now
+        screen.blit(self._panel, (self.position.x - 4, self.position.y - 4))
+        top = int(self.position.y)
+        for line in self._lines:
+            screen.blit(line, (self.position.x, top))
+            top += self._line_height
+        self._draw_graph(screen, top + 2)
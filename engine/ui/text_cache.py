@@ -0,0 +1,24 @@
+from functools import lru_cache
+from typing import Optional
+
+from pygame import font, surface
+
+from .. import settings
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> font.Font:
+    return font.Font(None, size)
+
+@lru_cache(maxsize=settings.TEXT_CACHE_SIZE)
+def render_text(text: str,
+                size: int,
+                color: tuple[int, int, int],
+                background: Optional[tuple[int, int, int]] = None) -> surface.Surface:
+    '''rendered text surfaces are shared, do not draw on them'''
+    return get_font(size).render(text, False, color, background)
+
+def clear() -> None:
+    '''drop cached fonts and text, fonts do not survive pygame.quit()'''
+    get_font.cache_clear()
+    render_text.cache_clear()
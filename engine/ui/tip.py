@@ -1,13 +1,28 @@
-from pygame import surface, Vector2, font
+from pygame import surface, Vector2
 
 from .. import settings
+from .text_cache import get_font, render_text
 
 class Tip:
-    def __init__(self, msg: str, position: Vector2, size: int) -> None:
+    def __init__(self, msg: str, position: Vector2, size: int, cached: bool = True) -> None:
         self.position  = position
-        self.font = font.Font(None, size)
+        self.font = get_font(size)
+        self._font_size = size
+        # text changing every frame would only evict the menus from the text cache
+        self._cached = cached
+        self._render(msg)
+
+    def _render(self, msg: str) -> None:
+        self.msg = msg
         self.size = self.font.size(msg)
-        self.render_font = self.font.render(msg, False, settings.RGB_WHITE)
+        if self._cached:
+            self.render_font = render_text(msg, self._font_size, settings.RGB_WHITE)
+        else:
+            self.render_font = self.font.render(msg, False, settings.RGB_WHITE)
+
+    def set_msg(self, msg: str) -> None:
+        if msg != self.msg:
+            self._render(msg)
 
     def _get_position(self) -> Vector2:
         return Vector2(self.position.x - self.size[0], self.position.y)
@@ -1,9 +1,55 @@
 #!/usr/bin/env python
-from engine import game
+import argparse
+import os
 
 
+def seed(value: str) -> int:
+    '''a seed that fits the 64 bit unsigned field of an input record'''
+    number = int(value)
+    if not 0 <= number < 2**64:
+        raise argparse.ArgumentTypeError(f'seed must be from 0 to 2**64 - 1, not {value}')
+    return number
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--headless', action='store_true',
+                        help='run a level without a window and print frame timings')
+    parser.add_argument('--level', type=int, default=0)
+    parser.add_argument('--frames', type=int, default=None,
+                        help='frames to run, defaults to 600 or the length of the replay')
+    parser.add_argument('--input', default=None,
+                        help='input script driving the player, a demo input is used without it')
+    parser.add_argument('--summary', action='store_true',
+                        help='only print the timing summary')
+    parser.add_argument('--seed', type=seed, default=None,
+                        help='random seed for enemies and screen shake')
+    parser.add_argument('--record', default=None,
+                        help='write the input of every update step to this file')
+    parser.add_argument('--replay', default=None,
+                        help='drive a headless run from a recorded input file')
+    parser.add_argument('--profile', default=None,
+                        help='log per frame section timings to this csv file, F3 shows them')
+    parser.add_argument('--convert-levels', action='store_true',
+                        help='write a binary level file for every pickled level and exit')
+    return parser.parse_args()
+
 def main() -> None:
-    _game = game.MainGame()
+    args = parse_args()
+    if args.convert_levels:
+        os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+        from engine import lib, settings
+        for level_path in lib.level_file.convert_world_data(settings.WORLD_DATA_PATH):
+            print(f'wrote {level_path}')
+        return
+    if args.headless:
+        # keep stdout to the timing output
+        os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+        from engine import headless
+        headless.run(args.level, args.frames, args.input, not args.summary,
+                     args.seed, args.replay, args.record)
+        return
+    from engine import game
+    _game = game.MainGame(args.record, args.profile)
     _game.run()
 
 if __name__ == '__main__':